@@ -1,7 +1,12 @@
+import os
+import sys
 import logging
+
+# Allow running as `python main_engine.py` from a checkout without installing the nexus package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
 from redteam_ai.redteam_ai import RedTeamAI
-from rd_team.feature_manager import FeatureManager
-from cybersecurity_ai.cybersecurity_ai import CybersecurityAI
+from redteam_ai.feature_manager import FeatureManager
+from redteam_ai.cybersecurity_ai.cybersecurity_ai import CybersecurityAI
 
 class SystemInterface:
     def __init__(self):
@@ -1,202 +0,0 @@
-# ==============================================================================
-# PROPRIETARY AND CONFIDENTIAL - NEXUS GENESIS ENGINE (v1.0.6)
-# ==============================================================================
-# Copyright (c) 2026 Nexus Infrastructure Group. All rights reserved.
-#
-# This source code, including all associated hardware emulation logic, 
-# neuromorphic threshold algorithms, and autonomous adversarial AI modules, 
-# is the intellectual property of Nexus. 
-#
-# NOTICE: This code is "Source-Available" for audit and transparency purposes
-# only. Unauthorized copying, modification, distribution, or commercial 
-# deployment of this file, via any medium, is strictly prohibited. 
-# 
-# Use of this software requires a valid Commercial License Agreement. 
-# For licensing inquiries, contact: legal@nexus-infrastructure.io
-# ==============================================================================
-
-import os
-import json
-import secrets
-import threading
-import time
-import numpy as np
-from datetime import datetime
-import hashlib
-import logging
-
-from sequencer import Sequencer
-from nexus_entropic_anchor import EntropicAnchor
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='[%(asctime)s] %(levelname)s: %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("nexus_core.log")
-    ]
-)
-
-# --- 1. THE PHYSICS LAYER: MEMRISTOR SGD ---
-class NeuromorphicThresholdGate:
-    def __init__(self, input_dim=5, learning_rate=0.05):
-        self.weights = np.random.randn(input_dim)
-        self.bias = np.random.randn()
-        self.learning_rate = learning_rate
-        self.lock = threading.Lock()
-
-    def compute_potential(self, signals):
-        with self.lock:
-            potential = np.dot(signals, self.weights) + self.bias
-        logging.debug(f"Computed potential: {potential:.4f}")
-        return potential
-
-    def adjust_sensitivity(self, target_met, signals):
-        error = 1.0 if target_met else -1.0
-        with self.lock:
-            self.weights += self.learning_rate * error * signals
-            self.bias += self.learning_rate * error
-        logging.debug(f"Adjusted weights to: {self.weights}, bias to: {self.bias}")
-
-# --- 2. THE LAW ENVELOPE & ADMISSIBILITY GATE ---
-class LegalVerificationLayer:
-    def __init__(self):
-        self.jurisdiction = os.getenv("NEXUS_ZONE", "GLOBAL_NEUTRAL")
-
-    def verify_admissibility(self, data_payload):
-        # Basic check for exposed private keys or sensitive info
-        if "PRIVATE_KEY" in str(data_payload).upper():
-            logging.warning("Admissibility failed due to exposed credentials.")
-            return False, "ADMISSIBILITY_FAILED: EXPOSED_CREDENTIALS"
-        return True, "VERIFIED_ADMISSIBLE"
-
-# --- 3. THE RED TEAM AI ---
-class RedTeamAgent(threading.Thread):
-    def __init__(self, target_core, attack_interval=2.0):
-        super().__init__()
-        self.target = target_core
-        self.daemon = True
-        self.attack_log = []
-        self.attack_interval = attack_interval
-        self._stop_event = threading.Event()
-
-    def run(self):
-        logging.info("Red Team Agent started.")
-        while not self._stop_event.is_set():
-            signals = np.random.uniform(-5.0, 5.0, 5)
-            data = {"exploit": "BUFFER_OVERFLOW_TEST", "payload": "0xDEADBEEF"}
-            success, _ = self.target.process_transaction(signals, data)
-            timestamp = datetime.now().isoformat()
-            if success:
-                entry = f"CRITICAL BREACH @ {timestamp}"
-                logging.error(entry)
-                self.attack_log.append(entry)
-            else:
-                entry = f"DEFENSE_STABLE @ {timestamp}"
-                logging.info(entry)
-                self.attack_log.append(entry)
-            time.sleep(self.attack_interval)
-
-    def stop(self):
-        self._stop_event.set()
-
-# --- 4. THE INTEGRATED NEXUS CORE WITH SEQUENCER ---
-class NexusCore:
-    def __init__(self, threshold=2.0, ledger_path="nexus_immutable_core.json"):
-        self.gate = NeuromorphicThresholdGate()
-        self.legal = LegalVerificationLayer()
-        self.threshold = threshold
-        self.ledger_path = ledger_path
-        self.ledger_lock = threading.Lock()
-
-        # Sequencer Integration
-        self.sequencer = Sequencer()
-        # Entropic Anchor Integration
-        self.entropic_anchor = EntropicAnchor()
-        self.previous_epoch_hash = "GENESIS"
-
-    def process_transaction(self, signals, data, user_id=None):
-        potential = self.gate.compute_potential(signals)
-        is_legal, legal_msg = self.legal.verify_admissibility(data)
-
-        # Entropic Anchor Check
-        anchor = self.entropic_anchor.calculate_causal_index(signals, self.previous_epoch_hash)
-        if not anchor.get('integrity_locked', False):
-            logging.warning(f"Entropic anchor violation detected for user {user_id}.")
-            if user_id:
-                self.sequencer.slash_user(user_id)
-            return False, "ENTROPIC_ANCHOR_VIOLATION"
-
-        # Main Threshold & Legal Check
-        if potential >= self.threshold and is_legal:
-            entropy = secrets.token_hex(32)
-            epoch_id = hashlib.sha3_256(f"{entropy}:{potential}".encode()).hexdigest()
-            self.previous_epoch_hash = epoch_id
-
-            result = {
-                "epoch": epoch_id,
-                "status": "COMMITTED",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            self._commit_to_ledger(result)
-            self.gate.adjust_sensitivity(True, signals)
-            logging.info(f"Transaction committed: {result['epoch'][:12]} for user {user_id}")
-            return True, result
-        else:
-            self.gate.adjust_sensitivity(False, signals)
-            if user_id:
-                self.sequencer.slash_user(user_id)
-                logging.warning(f"User {user_id} slashed due to gate closure or legal failure.")
-            return False, legal_msg if not is_legal else "GATE_CLOSED"
-
-    def _commit_to_ledger(self, entry):
-        with self.ledger_lock:
-            try:
-                with open(self.ledger_path, "a", encoding="utf-8") as f:
-                    f.write(json.dumps(entry) + "\n")
-                logging.debug(f"Ledger entry committed: {entry}")
-            except Exception as e:
-                logging.error(f"Failed to commit ledger entry: {e}")
-
-# --- 5. EXECUTION & MASTER CLOCK ---
-def main():
-    logging.info("--- NEXUS GENESIS INITIALIZED: MASTER CLOCK ONLINE ---")
-
-    nexus = NexusCore()
-    red_team = RedTeamAgent(nexus)
-    red_team.start()
-
-    # Register users and stake tokens
-    nexus.sequencer.register_user('user1')
-    nexus.sequencer.register_user('user2')
-    nexus.sequencer.stake_tokens('user1', 100)
-    nexus.sequencer.stake_tokens('user2', 200)
-
-    # Simulation of transactions
-    try:
-        for i in range(5):
-            logging.info(f"[Epoch Cycle {i}] Capturing Entropy...")
-
-            signals = np.array([0.8, 1.2, 0.9, 1.5, 0.7])
-            user = 'user1' if i % 2 == 0 else 'user2'
-            success, response = nexus.process_transaction(signals, {"event": "GLOBAL_SETTLEMENT"}, user_id=user)
-
-            if success:
-                logging.info(f"ADMISSIBILITY GATE OPEN: Epoch {response['epoch'][:12]} finalized for {user}.")
-            else:
-                logging.warning(f"TRANSACTION FAILED: {response} -> {user} has been slashed if applicable.")
-
-            time.sleep(1)
-    except KeyboardInterrupt:
-        logging.info("Shutdown requested by user.")
-    finally:
-        red_team.stop()
-        red_team.join()
-
-    logging.info(f"[Red Team Status]: {len(red_team.attack_log)} Probes Deflected.")
-    logging.info("Nexus Status: PERSISTENT | IMMUTABLE | ADMISSIBLE")
-    logging.info(f"Sequencer Reputation Scores: {nexus.sequencer.display_scores()}")
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
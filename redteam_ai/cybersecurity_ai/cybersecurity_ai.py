@@ -1,17 +1,24 @@
 import logging
 import re
 
+from nexus.metrics import registry as metrics_registry
+
 class CybersecurityAI:
-    def __init__(self, log_stream):
+    def __init__(self, log_stream, metrics=None):
         self.log_stream = log_stream
         self.logger = logging.getLogger('CybersecurityAI')
         self.logger.setLevel(logging.DEBUG)
+        self.metrics = metrics if metrics is not None else metrics_registry
 
     def analyze(self):
         self.logger.info("Starting cybersecurity log analysis.")
-        anomalies = self._detect_anomalies()
+        with self.metrics.time("cybersecurity.detect"):
+            anomalies = self._detect_anomalies()
+        self.metrics.inc("cybersecurity.entries_scanned", len(self.log_stream))
         if anomalies:
-            self._respond(anomalies)
+            self.metrics.inc("cybersecurity.anomalies", len(anomalies))
+            with self.metrics.time("cybersecurity.respond"):
+                self._respond(anomalies)
         else:
             self.logger.info("No anomalies detected.")
 
@@ -33,12 +40,12 @@ class CybersecurityAI:
         ]
         for pattern in suspicious_patterns:
             if re.search(pattern, log_entry, re.IGNORECASE):
-                self.logger.debug(f"Suspicious log entry detected: {log_entry}")
+                self.logger.debug("Suspicious log entry detected: %s", log_entry)
                 return True
         return False
 
     def _respond(self, anomalies):
-        self.logger.warning(f"Anomalies detected: {len(anomalies)} entries.")
+        self.logger.warning("Anomalies detected: %d entries.", len(anomalies))
         for anomaly in anomalies:
-            self.logger.warning(f"Anomaly: {anomaly}")
+            self.logger.warning("Anomaly: %s", anomaly)
         # Additional response logic could include alerting or automated mitigation
\ No newline at end of file
@@ -8,8 +8,12 @@ class FeatureManager:
         self.lock = threading.Lock()
 
     def _load_config(self):
-        with open(self.config_path, 'r') as f:
-            self.config = json.load(f)
+        # A missing config file means no feature flags are enabled yet
+        try:
+            with open(self.config_path, 'r') as f:
+                self.config = json.load(f)
+        except FileNotFoundError:
+            self.config = {}
         self.features = self.config.get("rd_team", {}).get("feature_flags", {})
 
     def is_feature_enabled(self, feature_name):
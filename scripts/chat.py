@@ -4,16 +4,22 @@ Breeze - Your Complete Personal Assistant, Advisor, and Strategist
 """
 
 import os
+import re
 import json
+import time
+import sqlite3
+import hashlib
 import datetime
-import openai
+import urllib.request
 
-# --- 1. Set API key ---
-api_key = os.getenv("OPENAI_API_KEY")
-if not api_key:
-    print("ERROR: OpenAI API key not found. Please set OPENAI_API_KEY.")
-    exit(1)
-openai.api_key = api_key
+# --- 1. Configuration ---
+MODEL = os.getenv("BREEZE_MODEL", "gpt-5")
+# Any OpenAI-compatible chat endpoint (e.g. a local stub server); unset uses the openai package
+API_BASE = os.getenv("BREEZE_API_BASE")
+CACHE_PATH = os.getenv("BREEZE_CACHE_PATH", os.path.expanduser("~/.breeze_cache.sqlite3"))
+CACHE_TTL = float(os.getenv("BREEZE_CACHE_TTL", 24 * 3600))  # seconds
+CACHE_MAX_ENTRIES = int(os.getenv("BREEZE_CACHE_MAX", 500))
+CACHE_ENABLED = os.getenv("BREEZE_CACHE", "1") != "0"
 
 # --- 2. System prompt for full personal assistant ---
 SYSTEM_PROMPT = """
@@ -48,24 +54,169 @@ def log_event(role, status, message):
     timestamp = datetime.datetime.now().isoformat()
     print(f"[{timestamp}] [{role}] [{status}] {message}")
 
-# --- 4. Core function for sending user input to GPT-5 ---
-def query_breeze(user_input):
-    try:
-        response = openai.ChatCompletion.create(
-            model="gpt-5",
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": user_input}
-            ]
+# --- 4. Backends: anything with stream(messages) yielding text chunks ---
+class OpenAIBackend:
+    def __init__(self, model=MODEL):
+        import openai
+
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise RuntimeError("OpenAI API key not found. Please set OPENAI_API_KEY.")
+        openai.api_key = api_key
+        self.openai = openai
+        self.model = model
+
+    def stream(self, messages):
+        response = self.openai.ChatCompletion.create(model=self.model, messages=messages, stream=True)
+        finished = False
+        for chunk in response:
+            choice = chunk['choices'][0]
+            content = choice.get('delta', {}).get('content')
+            if content:
+                yield content
+            finished = finished or choice.get('finish_reason') == "stop"
+        if not finished:
+            raise ConnectionError("Reply stream ended before the model finished.")
+
+
+class HTTPBackend:
+    """
+    Streams from an OpenAI-compatible /chat/completions endpoint over plain HTTP
+    (server-sent events), e.g. a local model server or a test stub. A stream
+    only counts as complete after 'data: [DONE]' or a 'stop' finish reason;
+    one that ends earlier raises, so a truncated reply is never cached.
+    """
+
+    def __init__(self, api_base, model=MODEL, timeout=60):
+        self.url = api_base.rstrip("/") + "/chat/completions"
+        self.model = model
+        self.timeout = timeout
+
+    def stream(self, messages):
+        body = json.dumps({"model": self.model, "messages": messages, "stream": True}).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        if os.getenv("OPENAI_API_KEY"):
+            headers["Authorization"] = f"Bearer {os.getenv('OPENAI_API_KEY')}"
+        request = urllib.request.Request(self.url, data=body, headers=headers)
+        finished = False
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            for raw in response:
+                line = raw.decode("utf-8").strip()
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    finished = True
+                    break
+                choice = json.loads(data)["choices"][0]
+                content = choice.get("delta", {}).get("content")
+                if content:
+                    yield content
+                finished = finished or choice.get("finish_reason") == "stop"
+        if not finished:
+            raise ConnectionError("Reply stream ended before the model finished.")
+
+
+def default_backend():
+    return HTTPBackend(API_BASE) if API_BASE else OpenAIBackend()
+
+# --- 5. Persistent response cache (LRU + TTL, keyed by normalized prompt hash) ---
+def normalize_prompt(text):
+    return re.sub(r"\s+", " ", text).strip().lower()
+
+
+class ResponseCache:
+    def __init__(self, path=CACHE_PATH, max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.db = sqlite3.connect(path)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, reply TEXT NOT NULL, created REAL NOT NULL, last_used REAL NOT NULL)"
         )
-        reply = response['choices'][0]['message']['content']
+        self.db.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+        self.db.commit()
+
+    @staticmethod
+    def key(user_input, model=MODEL, system_prompt=SYSTEM_PROMPT):
+        # The model and system prompt are part of the key so edits to either invalidate old replies
+        material = "\0".join([model, hashlib.sha256(system_prompt.encode("utf-8")).hexdigest(),
+                              normalize_prompt(user_input)])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key, now=None):
+        now = time.time() if now is None else now
+        row = self.db.execute("SELECT reply, created FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        reply, created = row
+        if now - created > self.ttl:
+            self.db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self.db.commit()
+            return None
+        self.db.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+        self.db.commit()
         return reply
+
+    def put(self, key, reply, now=None):
+        now = time.time() if now is None else now
+        self.db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)", (key, reply, now, now))
+        # Evict expired entries, then the least recently used beyond the size limit
+        self.db.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl,))
+        self.db.execute(
+            "DELETE FROM responses WHERE key NOT IN "
+            "(SELECT key FROM responses ORDER BY last_used DESC LIMIT ?)", (self.max_entries,)
+        )
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+# --- 6. Core functions for sending user input to GPT-5 ---
+def stream_breeze(user_input, backend=None, cache=None):
+    """
+    Yields the reply in chunks as they arrive. Cached replies are yielded in
+    one piece without contacting the backend; fresh replies are cached once
+    the stream completes. Errors are yielded as text and never cached.
+    """
+    # Replies are cached per model; without a backend, default_backend() uses MODEL
+    key = ResponseCache.key(user_input, getattr(backend, "model", MODEL)) if cache else None
+    if cache:
+        cached = cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+    messages = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": user_input}
+    ]
+    parts = []
+    try:
+        for chunk in (backend or default_backend()).stream(messages):
+            parts.append(chunk)
+            yield chunk
     except Exception as e:
         log_event("BREEZE", "ERROR", str(e))
-        return f"Error contacting AI: {str(e)}"
+        yield f"Error contacting AI: {str(e)}"
+        return
+    if cache and parts:
+        cache.put(key, "".join(parts))
+
+
+def query_breeze(user_input, backend=None, cache=None):
+    return "".join(stream_breeze(user_input, backend=backend, cache=cache))
+
+# --- 7. Main interactive loop ---
+def main(backend=None, cache=None):
+    try:
+        backend = backend or default_backend()
+    except Exception as e:
+        print(f"ERROR: {e}")
+        exit(1)
+    if cache is None and CACHE_ENABLED:
+        cache = ResponseCache()
 
-# --- 5. Main interactive loop ---
-def main():
     print("Breeze is online. Type 'exit' to quit.")
     while True:
         user_input = input(">> ").strip()
@@ -73,9 +224,13 @@ def main():
             print("Breeze signing off...")
             break
 
-        # Process input
-        reply = query_breeze(user_input)
-        print(reply)
+        # Process input, printing tokens as they stream in
+        parts = []
+        for chunk in stream_breeze(user_input, backend=backend, cache=cache):
+            parts.append(chunk)
+            print(chunk, end="", flush=True)
+        print()
+        reply = "".join(parts)
 
         # Attempt to parse structured JSON if present
         try:
@@ -87,5 +242,8 @@ def main():
         except Exception:
             pass
 
+    if cache:
+        cache.close()
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,61 @@
+"""
+Nexus Genesis Engine.
+
+Submodules are loaded on first attribute access, so `import nexus` stays
+cheap and free of side effects (no NumPy import, no logging handlers, no
+files opened). `nexus.NexusCore` pulls in `nexus.core` only when used.
+"""
+
+import importlib
+
+__version__ = "1.0.6"
+
+_LAZY_ATTRS = {
+    "NexusCore": "nexus.core",
+    "NeuromorphicThresholdGate": "nexus.core",
+    "LegalVerificationLayer": "nexus.core",
+    "RedTeamAgent": "nexus.core",
+    "EntropicAnchor": "nexus.entropic_anchor",
+    "HomeostaticRecovery": "nexus.homeostatic_recovery",
+    "Sequencer": "nexus.sequencer",
+    "ShardedNexus": "nexus.sharding",
+    "ReputationManager": "nexus.reputation",
+    "SlashingManager": "nexus.reputation",
+    "MetricsRegistry": "nexus.metrics",
+}
+
+_LAZY_SUBMODULES = {
+    "bench",
+    "cli",
+    "core",
+    "entropic_anchor",
+    "health_check",
+    "homeostatic_recovery",
+    "ledger",
+    "log",
+    "merkle",
+    "metrics",
+    "replay",
+    "replication",
+    "reputation",
+    "sequencer",
+    "sharding",
+    "soak",
+}
+
+__all__ = sorted(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | _LAZY_SUBMODULES)
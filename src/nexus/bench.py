@@ -0,0 +1,81 @@
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def measure_startup(statement="import nexus", runs=5, python=sys.executable):
+    """
+    Times cold interpreter starts executing `statement`, one fresh process per
+    run so that nothing is served from an already-warm module cache.
+
+    Returns:
+        list: Wall time of each run in seconds.
+    """
+    # Make the package under test importable even when it is not installed
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([python, "-c", statement], check=True, env=env)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def measure_throughput(transactions=1000, threshold=-1000.0, ledger_path=None):
+    """
+    Drives `transactions` forced commits through a fresh NexusCore.
+
+    Returns:
+        float: Transactions per second.
+    """
+    import numpy as np
+
+    from nexus.core import NexusCore
+
+    with tempfile.TemporaryDirectory() as tmp:
+        nexus = NexusCore(threshold=threshold, ledger_path=ledger_path or os.path.join(tmp, "bench_ledger.json"))
+        signals = np.array([0.8, 1.2, 0.9, 1.5, 0.7])
+        start = time.perf_counter()
+        for _ in range(transactions):
+            nexus.process_transaction(signals, {"event": "BENCHMARK"})
+        elapsed = time.perf_counter() - start
+    return transactions / elapsed if elapsed > 0 else float("inf")
+
+
+def measure_sharded_throughput(transactions=1000, shards=None, threshold=-1000.0, batch_size=1024):
+    """
+    Drives `transactions` forced commits through a ShardedNexus in batches,
+    spread over 64 users so every shard receives work.
+
+    Returns:
+        float: Transactions per second across all shards.
+    """
+    import numpy as np
+
+    from nexus.sharding import ShardedNexus
+
+    user_ids = [f"bench-{i % 64}" for i in range(transactions)]
+    signals = np.tile(np.array([0.8, 1.2, 0.9, 1.5, 0.7]), (transactions, 1))
+    with tempfile.TemporaryDirectory() as tmp:
+        with ShardedNexus(shards=shards, threshold=threshold, ledger_dir=tmp, batch_capacity=batch_size) as nexus:
+            start = time.perf_counter()
+            for offset in range(0, transactions, batch_size):
+                nexus.process_batch(signals[offset:offset + batch_size], {"event": "BENCHMARK"},
+                                    user_ids[offset:offset + batch_size])
+            elapsed = time.perf_counter() - start
+    return transactions / elapsed if elapsed > 0 else float("inf")
+
+
+def summarize(timings):
+    return {
+        "runs": len(timings),
+        "min_ms": round(min(timings) * 1000, 2),
+        "median_ms": round(statistics.median(timings) * 1000, 2),
+        "max_ms": round(max(timings) * 1000, 2),
+    }
@@ -0,0 +1,235 @@
+"""
+Unified `nexus` command line entry point.
+
+Each subcommand imports only the modules it needs, inside its handler, so
+`nexus --help` and `nexus verify` never pay for NumPy or the core engine.
+"""
+
+import argparse
+import json
+import sys
+import threading
+
+from nexus.soak import add_soak_arguments, check_soak_arguments
+
+
+def _cmd_run(args):
+    from nexus.core import main as run_core
+
+    return run_core(trace_path=args.record, ship=args.ship, metrics_path=args.metrics,
+                    metrics_format=args.metrics_format)
+
+
+def _cmd_health(args):
+    from nexus.health_check import run_from_args
+
+    return run_from_args(args)
+
+
+def _cmd_bench(args):
+    from nexus import bench
+
+    results = {"startup": bench.summarize(bench.measure_startup(args.statement, runs=args.runs))}
+    if args.transactions:
+        results["throughput_tps"] = round(bench.measure_throughput(args.transactions), 1)
+        if args.shards:
+            results["sharded_throughput_tps"] = round(
+                bench.measure_sharded_throughput(args.transactions, shards=args.shards), 1)
+    print(json.dumps(results, indent=2))
+
+    if args.max_startup_ms is not None and results["startup"]["median_ms"] > args.max_startup_ms:
+        print(f"FAIL: median cold start {results['startup']['median_ms']} ms exceeds "
+              f"{args.max_startup_ms} ms budget.", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _cmd_verify(args):
+    from nexus.ledger import verify_ledger
+
+    report = verify_ledger(args.ledger)
+    print(f"Ledger {args.ledger}: {report['entries']} entries, {report['committed']} committed.")
+    for line_number, reason in report["errors"]:
+        print(f"  line {line_number}: {reason}")
+    return 1 if report["errors"] else 0
+
+
+def _cmd_replicate(args):
+    import signal
+
+    from nexus import log as nexus_log
+    from nexus.replication import LedgerFollower, LedgerShipper, config_from_env
+
+    config = config_from_env()
+    role = args.role or config["role"]
+    ledger_path = args.ledger or config["ledger_path" if role == "primary" else "replica_path"]
+    port = args.port or config["port"]
+
+    nexus_log.configure(log_path=None)
+    if role == "primary":
+        node = LedgerShipper(ledger_path, host=args.host or config["bind_host"], port=port).start()
+    else:
+        node = LedgerFollower(ledger_path, config["node_id"], host=args.host or config["primary_host"], port=port).start()
+
+    stopped = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopped.set())
+    try:
+        while not stopped.wait(0.5):
+            if getattr(node, "error", None):
+                return 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        node.stop()
+    return 0
+
+
+def _cmd_seal(args):
+    from nexus.merkle import build_blocks_from_ledger
+
+    blocks = build_blocks_from_ledger(args.ledger, args.blocks, block_size=args.block_size)
+    print(f"Sealed {args.ledger} into {blocks} block(s) at {args.blocks}.")
+    return 0
+
+
+def _cmd_prove(args):
+    from nexus.merkle import BlockStore
+
+    proof = BlockStore(args.blocks).prove(args.epoch)
+    if proof is None:
+        print(f"Epoch {args.epoch} is not sealed in {args.blocks}.", file=sys.stderr)
+        return 1
+    print(json.dumps(proof, indent=2))
+    return 0
+
+
+def _cmd_verify_proof(args):
+    from nexus.merkle import BlockStore, verify_proof
+
+    with open(args.proof, "r", encoding="utf-8") as f:
+        proof = json.load(f)
+    root = args.root
+    if root is None:
+        # Trust only our own blocks file, never the root the proof brings along
+        roots = BlockStore(args.blocks).roots
+        block = proof.get("block")
+        if not isinstance(block, int) or not 0 <= block < len(roots):
+            print(f"INVALID: block {block!r} is not sealed in {args.blocks}.")
+            return 1
+        root = roots[block]
+    if verify_proof(proof, root):
+        print(f"VALID: epoch {proof['epoch'][:12]} is included in block {proof.get('block')} ({root[:12]}).")
+        return 0
+    print("INVALID: proof does not commit the epoch to the expected root.")
+    return 1
+
+
+def _cmd_replay(args):
+    from nexus.replay import diff_ledgers, diff_states, replay_trace
+
+    report = replay_trace(args.trace, args.ledger, seed=args.seed, speed=args.speed, threshold=args.threshold,
+                          state_path=args.state)
+    print(f"Replayed {report['events']} events ({report['transactions']} transactions) in "
+          f"{report['elapsed_s']} s: {report['throughput_tps']} tps, "
+          f"{report['commits']} committed, {report['rejects']} rejected.")
+
+    differences = []
+    if args.against_ledger:
+        differences += [f"ledger line {n}: {a!r} != {b!r}" for n, a, b in diff_ledgers(args.ledger, args.against_ledger)]
+    if args.against_state:
+        with open(args.against_state, "r", encoding="utf-8") as f:
+            expected = json.load(f)
+        differences += diff_states(json.loads(json.dumps(report["sequencer"])), expected)
+    for difference in differences:
+        print(f"DIFF: {difference}")
+    return 1 if differences else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="nexus", description="Nexus Genesis Engine")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="Start the master clock and Red Team agent.")
+    run.add_argument("--record", default=None, metavar="TRACE",
+                     help="Record every transaction to this trace file for later replay.")
+    run.add_argument("--ship", action="store_true",
+                     help="Primary only: also serve the ledger to followers, waking them on every append.")
+    run.add_argument("--metrics", default=None, metavar="PATH",
+                     help="Enable metrics and write them here on SIGUSR1 and at shutdown (default: NEXUS_METRICS_PATH).")
+    run.add_argument("--metrics-format", choices=("prometheus", "json"), default=None,
+                     help="Metrics file format (default: NEXUS_METRICS_FORMAT or prometheus).")
+    run.set_defaults(handler=_cmd_run)
+
+    health = subparsers.add_parser("health", help="Run the system health check, or a soak gate with --soak.")
+    add_soak_arguments(health)
+    health.set_defaults(handler=_cmd_health)
+
+    bench = subparsers.add_parser("bench", help="Measure cold-start latency and core throughput.")
+    bench.add_argument("--runs", type=int, default=5, help="Cold starts to time (default: 5).")
+    bench.add_argument("--statement", default="import nexus",
+                       help="Python statement each cold start executes (default: 'import nexus').")
+    bench.add_argument("--transactions", type=int, default=0,
+                       help="Also time this many forced commits through NexusCore.")
+    bench.add_argument("--shards", type=int, default=0,
+                       help="With --transactions, also time them through this many process shards.")
+    bench.add_argument("--max-startup-ms", type=float, default=None,
+                       help="Exit non-zero if the median cold start exceeds this budget.")
+    bench.set_defaults(handler=_cmd_bench)
+
+    replicate = subparsers.add_parser("replicate", help="Ship the ledger (primary) or mirror it (follower).")
+    replicate.add_argument("--role", choices=("primary", "follower"), default=None,
+                           help="Defaults to the role implied by NEXUS_NODE_ID.")
+    replicate.add_argument("--ledger", default=None,
+                           help="Ledger to ship (default: NEXUS_LEDGER_PATH) or mirror into (default: NEXUS_REPLICA_PATH).")
+    replicate.add_argument("--host", default=None,
+                           help="Bind address (primary) or primary address (follower).")
+    replicate.add_argument("--port", type=int, default=None, help="Replication port (default: NEXUS_REPLICATION_PORT).")
+    replicate.set_defaults(handler=_cmd_replicate)
+
+    seal = subparsers.add_parser("seal", help="Seal an existing ledger's epochs into Merkle blocks.")
+    seal.add_argument("ledger", nargs="?", default="nexus_immutable_core.json")
+    seal.add_argument("--blocks", default="nexus_blocks.json", help="Blocks file to (re)write.")
+    seal.add_argument("--block-size", type=int, default=1024, help="Epochs per block (default: 1024).")
+    seal.set_defaults(handler=_cmd_seal)
+
+    prove = subparsers.add_parser("prove", help="Print the Merkle inclusion proof for an epoch.")
+    prove.add_argument("epoch")
+    prove.add_argument("--blocks", default="nexus_blocks.json")
+    prove.set_defaults(handler=_cmd_prove)
+
+    verify_proof = subparsers.add_parser("verify-proof", help="Check an inclusion proof without the ledger.")
+    verify_proof.add_argument("proof", help="JSON file written by 'nexus prove'.")
+    trusted = verify_proof.add_mutually_exclusive_group(required=True)
+    trusted.add_argument("--root", default=None, help="Trusted block root the proof must commit to.")
+    trusted.add_argument("--blocks", default=None, help="Trusted blocks file to look up the proof's block root in.")
+    verify_proof.set_defaults(handler=_cmd_verify_proof)
+
+    replay = subparsers.add_parser("replay", help="Replay a recorded trace deterministically.")
+    replay.add_argument("trace")
+    replay.add_argument("--ledger", default="nexus_replay_ledger.json", help="Ledger the replay writes (recreated).")
+    replay.add_argument("--state", default=None, help="Write the final Sequencer state here.")
+    replay.add_argument("--seed", type=int, default=0, help="Seed for epoch entropy (default: 0).")
+    replay.add_argument("--speed", type=float, default=None,
+                        help="Time-scale factor for recorded inter-arrival times (default: as fast as possible).")
+    replay.add_argument("--threshold", type=float, default=None, help="Override the recorded gate threshold.")
+    replay.add_argument("--against-ledger", default=None, help="Ledger from an earlier replay to diff against.")
+    replay.add_argument("--against-state", default=None, help="Sequencer state from an earlier replay to diff against.")
+    replay.set_defaults(handler=_cmd_replay)
+
+    verify = subparsers.add_parser("verify", help="Check the structure of a ledger file.")
+    verify.add_argument("ledger", nargs="?", default="nexus_immutable_core.json")
+    verify.set_defaults(handler=_cmd_verify)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "health":
+        check_soak_arguments(parser, args)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,298 @@
+# ==============================================================================
+# PROPRIETARY AND CONFIDENTIAL - NEXUS GENESIS ENGINE (v1.0.6)
+# ==============================================================================
+# Copyright (c) 2026 Nexus Infrastructure Group. All rights reserved.
+#
+# This source code, including all associated hardware emulation logic, 
+# neuromorphic threshold algorithms, and autonomous adversarial AI modules, 
+# is the intellectual property of Nexus. 
+#
+# NOTICE: This code is "Source-Available" for audit and transparency purposes
+# only. Unauthorized copying, modification, distribution, or commercial 
+# deployment of this file, via any medium, is strictly prohibited. 
+# 
+# Use of this software requires a valid Commercial License Agreement. 
+# For licensing inquiries, contact: legal@nexus-infrastructure.io
+# ==============================================================================
+
+import os
+import json
+import secrets
+import threading
+import time
+import numpy as np
+from datetime import datetime, timezone
+import hashlib
+
+from nexus import log as nexus_log
+from nexus.sequencer import Sequencer
+from nexus.entropic_anchor import EntropicAnchor
+from nexus.merkle import DEFAULT_BLOCK_SIZE, EpochBlockBuilder
+from nexus.metrics import export_on_signal, registry as metrics_registry
+
+# Handlers are installed by nexus_log.configure() in main(), not at import
+logger = nexus_log.get_logger("core")
+
+# --- 1. THE PHYSICS LAYER: MEMRISTOR SGD ---
+class NeuromorphicThresholdGate:
+    def __init__(self, input_dim=5, learning_rate=0.05, rng=None):
+        # rng: NumPy Generator (or the np.random module) drawing the initial weights
+        rng = rng if rng is not None else np.random
+        self.weights = rng.standard_normal(input_dim)
+        self.bias = rng.standard_normal()
+        self.learning_rate = learning_rate
+        self.lock = threading.Lock()
+
+    def compute_potential(self, signals):
+        with self.lock:
+            potential = np.dot(signals, self.weights) + self.bias
+        logger.debug("Computed potential: %.4f", potential)
+        return potential
+
+    def adjust_sensitivity(self, target_met, signals):
+        error = 1.0 if target_met else -1.0
+        with self.lock:
+            self.weights += self.learning_rate * error * signals
+            self.bias += self.learning_rate * error
+        logger.debug("Adjusted weights to: %s, bias to: %s", self.weights, self.bias)
+
+# --- 2. THE LAW ENVELOPE & ADMISSIBILITY GATE ---
+class LegalVerificationLayer:
+    def __init__(self):
+        self.jurisdiction = os.getenv("NEXUS_ZONE", "GLOBAL_NEUTRAL")
+
+    def verify_admissibility(self, data_payload):
+        # Basic check for exposed private keys or sensitive info
+        if "PRIVATE_KEY" in str(data_payload).upper():
+            logger.warning("Admissibility failed due to exposed credentials.")
+            return False, "ADMISSIBILITY_FAILED: EXPOSED_CREDENTIALS"
+        return True, "VERIFIED_ADMISSIBLE"
+
+# --- 3. THE RED TEAM AI ---
+class RedTeamAgent(threading.Thread):
+    def __init__(self, target_core, attack_interval=2.0):
+        super().__init__()
+        self.target = target_core
+        self.daemon = True
+        self.attack_log = []
+        self.attack_interval = attack_interval
+        self._stop_event = threading.Event()
+
+    def run(self):
+        logger.info("Red Team Agent started.")
+        while not self._stop_event.is_set():
+            signals = np.random.uniform(-5.0, 5.0, 5)
+            data = {"exploit": "BUFFER_OVERFLOW_TEST", "payload": "0xDEADBEEF"}
+            success, _ = self.target.process_transaction(signals, data)
+            timestamp = datetime.now().isoformat()
+            if success:
+                entry = f"CRITICAL BREACH @ {timestamp}"
+                logger.error("%s", entry, extra={"event": "CRITICAL_BREACH"})
+                self.attack_log.append(entry)
+            else:
+                entry = f"DEFENSE_STABLE @ {timestamp}"
+                logger.info("%s", entry, extra={"event": "DEFENSE_STABLE"})
+                self.attack_log.append(entry)
+            time.sleep(self.attack_interval)
+
+    def stop(self):
+        self._stop_event.set()
+
+# --- 4. THE INTEGRATED NEXUS CORE WITH SEQUENCER ---
+class NexusCore:
+    def __init__(self, threshold=2.0, ledger_path="nexus_immutable_core.json", metrics=None,
+                 blocks_path=None, block_size=DEFAULT_BLOCK_SIZE, rng=None, entropy_source=None, clock=None):
+        # Injectable randomness and time, so that traces can be replayed deterministically:
+        #   rng            - NumPy Generator for the gate weights (default: global np.random)
+        #   entropy_source - callable returning the hex entropy behind each epoch id
+        #   clock          - callable returning wall time in nanoseconds
+        self.entropy_source = entropy_source if entropy_source is not None else (lambda: secrets.token_hex(32))
+        self.clock = clock if clock is not None else time.time_ns
+        self.gate = NeuromorphicThresholdGate(rng=rng)
+        self.legal = LegalVerificationLayer()
+        self.threshold = threshold
+        self.ledger_path = ledger_path
+        self.ledger_lock = threading.Lock()
+
+        # Sequencer Integration
+        self.sequencer = Sequencer()
+        # Entropic Anchor Integration
+        self.entropic_anchor = EntropicAnchor(clock=self.clock)
+        self.previous_epoch_hash = "GENESIS"
+        # Per-stage latency histograms and event counters (no-op unless enabled)
+        self.metrics = metrics if metrics is not None else metrics_registry
+        # Callables invoked, in ledger order, with each entry after it is appended (e.g. replication)
+        self.ledger_listeners = []
+        # Merkle block sealing of committed epochs (disabled unless blocks_path is set)
+        self.block_builder = None
+        if blocks_path:
+            self.block_builder = EpochBlockBuilder(blocks_path, block_size)
+            # Epochs still pending when a previous run stopped are sealed before new ones
+            self.block_builder.recover(ledger_path)
+            self.ledger_listeners.append(self.block_builder.add)
+
+    def process_transaction(self, signals, data, user_id=None):
+        with self.metrics.time("core.transaction"):
+            return self._process_transaction(signals, data, user_id)
+
+    def _process_transaction(self, signals, data, user_id):
+        metrics = self.metrics
+        with metrics.time("core.gate"):
+            potential = self.gate.compute_potential(signals)
+        with metrics.time("core.legal"):
+            is_legal, legal_msg = self.legal.verify_admissibility(data)
+
+        # Entropic Anchor Check
+        with metrics.time("core.anchor"):
+            anchor = self.entropic_anchor.calculate_causal_index(signals, self.previous_epoch_hash)
+        if not anchor.get('integrity_locked', False):
+            logger.warning("Entropic anchor violation detected for user %s.", user_id)
+            metrics.inc("core.rejections")
+            if user_id:
+                self._slash(user_id)
+            return False, "ENTROPIC_ANCHOR_VIOLATION"
+
+        # Main Threshold & Legal Check
+        if potential >= self.threshold and is_legal:
+            entropy = self.entropy_source()
+            epoch_id = hashlib.sha3_256(f"{entropy}:{potential}".encode()).hexdigest()
+            self.previous_epoch_hash = epoch_id
+
+            result = {
+                "epoch": epoch_id,
+                "status": "COMMITTED",
+                "timestamp": self._timestamp()
+            }
+            with metrics.time("core.ledger"):
+                self._commit_to_ledger(result)
+            with metrics.time("core.gate_adjust"):
+                self.gate.adjust_sensitivity(True, signals)
+            metrics.inc("core.commits")
+            logger.info("Transaction committed: %.12s for user %s", epoch_id, user_id,
+                        extra={"event": "COMMITTED"})
+            return True, result
+        else:
+            with metrics.time("core.gate_adjust"):
+                self.gate.adjust_sensitivity(False, signals)
+            metrics.inc("core.rejections")
+            if user_id:
+                self._slash(user_id)
+                logger.warning("User %s slashed due to gate closure or legal failure.", user_id,
+                               extra={"event": "SLASHED"})
+            return False, legal_msg if not is_legal else "GATE_CLOSED"
+
+    def _timestamp(self):
+        # Naive UTC ISO-8601, matching the datetime.utcnow().isoformat() ledger format
+        ns = self.clock()
+        seconds, remainder = divmod(ns, 1_000_000_000)
+        moment = datetime.fromtimestamp(seconds, tz=timezone.utc).replace(microsecond=remainder // 1000, tzinfo=None)
+        return moment.isoformat()
+
+    def _slash(self, user_id):
+        with self.metrics.time("core.sequencer"):
+            self.sequencer.slash_user(user_id)
+        self.metrics.inc("core.slashes")
+
+    def _commit_to_ledger(self, entry):
+        with self.ledger_lock:
+            try:
+                with open(self.ledger_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry) + "\n")
+                logger.debug("Ledger entry committed: %s", entry)
+            except Exception as e:
+                logger.error("Failed to commit ledger entry: %s", e)
+                return
+            for listener in self.ledger_listeners:
+                listener(entry)
+
+# --- 5. EXECUTION & MASTER CLOCK ---
+def main(trace_path=None, ship=False, metrics_path=None, metrics_format=None):
+    import signal
+
+    from nexus.replication import LedgerShipper, config_from_env
+
+    nexus_log.configure()
+    config = config_from_env()
+    if os.path.abspath(config["ledger_path"]) == os.path.abspath(config["replica_path"]):
+        # The mirrored ledger must stay an exact copy of the primary's
+        logger.error("Refusing to run: %s is also the replication mirror (NEXUS_REPLICA_PATH).",
+                     config["ledger_path"])
+        nexus_log.shutdown()
+        return 1
+    if ship and config["role"] != "primary":
+        logger.error("Refusing to ship the ledger from %s: only a primary node ships.", config["node_id"])
+        nexus_log.shutdown()
+        return 1
+    logger.info("--- NEXUS GENESIS INITIALIZED: MASTER CLOCK ONLINE ---")
+
+    # Metrics are dumped on SIGUSR1 and once more on shutdown
+    metrics_path = metrics_path or os.getenv("NEXUS_METRICS_PATH")
+    metrics_format = metrics_format or os.getenv("NEXUS_METRICS_FORMAT", "prometheus")
+    previous_handler = None
+    if metrics_path:
+        metrics_registry.enable()
+        previous_handler = export_on_signal(metrics_path, metrics_format)
+        logger.info("Writing %s metrics to %s on SIGUSR1 and at shutdown.", metrics_format, metrics_path)
+
+    nexus = NexusCore(
+        threshold=config["threshold"],
+        ledger_path=config["ledger_path"],
+        blocks_path=os.getenv("NEXUS_BLOCKS_PATH", "nexus_blocks.json"),
+    )
+    shipper = None
+    if ship:
+        shipper = LedgerShipper(config["ledger_path"], host=config["bind_host"], port=config["port"]).start()
+        nexus.ledger_listeners.append(shipper.notify)
+    recorder = None
+    if trace_path:
+        from nexus.replay import TraceRecorder
+        recorder = TraceRecorder(trace_path).attach(nexus)
+        logger.info("Recording transaction trace to %s", trace_path)
+    red_team = RedTeamAgent(nexus)
+    red_team.start()
+
+    # Register users and stake tokens
+    nexus.sequencer.register_user('user1')
+    nexus.sequencer.register_user('user2')
+    nexus.sequencer.stake_tokens('user1', 100)
+    nexus.sequencer.stake_tokens('user2', 200)
+
+    # Simulation of transactions
+    try:
+        for i in range(5):
+            logger.info("[Epoch Cycle %d] Capturing Entropy...", i)
+
+            signals = np.array([0.8, 1.2, 0.9, 1.5, 0.7])
+            user = 'user1' if i % 2 == 0 else 'user2'
+            success, response = nexus.process_transaction(signals, {"event": "GLOBAL_SETTLEMENT"}, user_id=user)
+
+            if success:
+                logger.info("ADMISSIBILITY GATE OPEN: Epoch %.12s finalized for %s.", response['epoch'], user)
+            else:
+                logger.warning("TRANSACTION FAILED: %s -> %s has been slashed if applicable.", response, user)
+
+            time.sleep(1)
+    except KeyboardInterrupt:
+        logger.info("Shutdown requested by user.")
+    finally:
+        red_team.stop()
+        red_team.join()
+        if nexus.block_builder:
+            nexus.block_builder.flush()
+        if recorder:
+            recorder.close()
+        if shipper:
+            shipper.stop()
+        if metrics_path:
+            metrics_registry.export(metrics_path, metrics_format)
+            if previous_handler is not None:
+                signal.signal(signal.SIGUSR1, previous_handler)
+
+    logger.info("[Red Team Status]: %d Probes Deflected.", len(red_team.attack_log))
+    logger.info("Nexus Status: PERSISTENT | IMMUTABLE | ADMISSIBLE")
+    logger.info("Sequencer Reputation Scores: %s", nexus.sequencer.display_scores())
+    nexus_log.shutdown()
+    return 0
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -9,7 +9,9 @@ class EntropicAnchor:
     arrow of time and thermodynamic cost.
     """
 
-    def __init__(self):
+    def __init__(self, clock=None):
+        # Source of the causal timestamp in nanoseconds (injectable for deterministic replay)
+        self.clock = clock if clock is not None else time.time_ns
         # Boltzmann constant (Physical anchor) in J/K
         self.k_B = 1.380649e-23
         # Standard Temperature (Kelvin) for energy cost calculation
@@ -31,7 +33,7 @@ class EntropicAnchor:
         Returns:
             dict: Contains 'anchor_id', 'causal_timestamp', 'thermodynamic_cost', 'integrity_locked'.
         """
-        timestamp = time.time_ns()
+        timestamp = self.clock()
         state_data = f"{input_vector}{previous_hash}{timestamp}"
 
         # Generate the Proof of Entropy (PoE) using SHA3-512
@@ -69,5 +71,24 @@ class EntropicAnchor:
         else:
             raise Exception("SYSTEM_ENTROPY_COLLAPSE")
 
-# Integration point for Nexus 2046
-nexus_core = EntropicAnchor()
\ No newline at end of file
+    def validate_epoch_inclusion(self, proof, trusted_root):
+        """
+        Validates that an external system's epoch is sealed in a Nexus block,
+        using a Merkle inclusion proof instead of the ledger itself.
+
+        Args:
+            proof (dict): Inclusion proof from nexus.merkle.BlockStore.prove.
+            trusted_root (str): Block root the verifier already trusts.
+
+        Returns:
+            str: "STATE_SYNCHRONIZED" if the proof checks out in O(log n).
+
+        Raises:
+            Exception: If the proof does not commit the epoch to the trusted root.
+        """
+        from nexus.merkle import verify_proof
+
+        if verify_proof(proof, trusted_root):
+            return "STATE_SYNCHRONIZED"
+        else:
+            raise Exception("SYSTEM_ENTROPY_COLLAPSE")
\ No newline at end of file
@@ -2,66 +2,69 @@
 # NEXUS SOURCE-AVAILABLE SOVEREIGN LICENSE (v1.0)
 # ==============================================================================
 
-Copyright (c) 2026 Nexus Infrastructure Group. All rights reserved.
-
-This software, including all source code, configurations, and documentation 
-(collectively, the "Software"), is proprietary and source-available under the
-terms below.
-
-1. DEFINITIONS
-   • "Nexus" refers to Nexus Infrastructure Group, the sole authority for this
-     Software.
-   • "Audit" means read-only review of the Software for the purpose of 
-     validation, research, or compliance. No execution or derivative work 
-     beyond allowed dependencies is permitted without explicit Nexus approval.
-
-2. LICENSE GRANT
-   Nexus grants the following limited rights:
-   2.1 Audit Rights: Authorized third parties may review the Software for
-        transparency, research, or compliance purposes only.
-   2.2 Operational Dependency: Integration with the Software may occur only
-        through official APIs or channels explicitly authorized by Nexus.
-   2.3 Research Use: Non-commercial, academic, or governmental review is
-        permitted with written permission from Nexus.
-
-3. PROHIBITED USES
-   • No reproduction, distribution, or modification outside granted rights.
-   • No forking, rehosting, or rebranding without Nexus approval.
-   • No commercial exploitation without a formal license agreement.
-
-4. AUTHORITY
-   Nexus is the canonical source for this Software. Any reliance on it outside
-   authorized channels is at the user's risk.
-
-5. LIABILITY
-   • The Software is provided "as-is."
-   • Nexus disclaims all warranties, express or implied.
-   • Nexus is not responsible for losses arising from use, execution, or
-     integration.
-
-6. GOVERNING LAW
-   This License is governed by the laws of the State of North Dakota, United
-   States of America. Exclusive jurisdiction lies in the courts of Fargo, ND.
-
-7. ENFORCEMENT
-   Any use outside this License is considered infringement and will be subject
-   to legal action.
-
+# Copyright (c) 2026 Nexus Infrastructure Group. All rights reserved.
+#
+# This software, including all source code, configurations, and documentation
+# (collectively, the "Software"), is proprietary and source-available under the
+# terms below.
+#
+# 1. DEFINITIONS
+#    • "Nexus" refers to Nexus Infrastructure Group, the sole authority for this
+#      Software.
+#    • "Audit" means read-only review of the Software for the purpose of
+#      validation, research, or compliance. No execution or derivative work
+#      beyond allowed dependencies is permitted without explicit Nexus approval.
+#
+# 2. LICENSE GRANT
+#    Nexus grants the following limited rights:
+#    2.1 Audit Rights: Authorized third parties may review the Software for
+#         transparency, research, or compliance purposes only.
+#    2.2 Operational Dependency: Integration with the Software may occur only
+#         through official APIs or channels explicitly authorized by Nexus.
+#    2.3 Research Use: Non-commercial, academic, or governmental review is
+#         permitted with written permission from Nexus.
+#
+# 3. PROHIBITED USES
+#    • No reproduction, distribution, or modification outside granted rights.
+#    • No forking, rehosting, or rebranding without Nexus approval.
+#    • No commercial exploitation without a formal license agreement.
+#
+# 4. AUTHORITY
+#    Nexus is the canonical source for this Software. Any reliance on it outside
+#    authorized channels is at the user's risk.
+#
+# 5. LIABILITY
+#    • The Software is provided "as-is."
+#    • Nexus disclaims all warranties, express or implied.
+#    • Nexus is not responsible for losses arising from use, execution, or
+#      integration.
+#
+# 6. GOVERNING LAW
+#    This License is governed by the laws of the State of North Dakota, United
+#    States of America. Exclusive jurisdiction lies in the courts of Fargo, ND.
+#
+# 7. ENFORCEMENT
+#    Any use outside this License is considered infringement and will be subject
+#    to legal action.
+#
 # End of License
-
+#
 
 import time
 import hashlib
 import random
 
+from nexus.metrics import registry as metrics_registry
+
 class HomeostaticRecovery:
     """
     NEXUS RECOVERY: Autonomous Self-Healing via Recursive Resynthesis.
     Triggers when Sy < Threshold to reverse Systemic Entropy.
     """
-    def __init__(self, engine):
+    def __init__(self, engine, metrics=None):
         self.engine = engine  # Link to nexus_syntropy_core.py
         self.recovery_log = []
+        self.metrics = metrics if metrics is not None else metrics_registry
 
     def initiate_coherence_reboot(self, system_id, entropy_level):
         """
@@ -83,7 +86,8 @@ class HomeostaticRecovery:
         
         # In a real system, this would involve ZK-Proofs to verify state 
         # without processing the corrupted logic.
-        new_hash = hashlib.sha3_512(corrupted_data).hexdigest()
+        with self.metrics.time("recovery.resynthesis"):
+            new_hash = hashlib.sha3_512(corrupted_data).hexdigest()
         return new_hash
 
     def heal(self, report):
@@ -95,9 +99,11 @@ class HomeostaticRecovery:
 
         start_time = time.time()
         sys_id = report["system_id"]
-        
+        metrics = self.metrics
+
         # 1. Isolate Noise
-        bad_nodes = self.initiate_coherence_reboot(sys_id, report["syntropy_index"])
+        with metrics.time("recovery.isolate"):
+            bad_nodes = self.initiate_coherence_reboot(sys_id, report["syntropy_index"])
         
         # 2. Re-balance Energy (Homeostasis)
         # We increase the energy efficiency factor by 'throttling' non-essential logic
@@ -106,9 +112,13 @@ class HomeostaticRecovery:
         # 3. Verify Healing via Syntropy Re-calculation
         # We simulate 'clean' data after the purge
         clean_data = [1, 1, 0, 1, 1] * 100 
-        new_sy = self.engine.calculate_syntropy_yield(0.1, new_efficiency, clean_data)
-        
+        with metrics.time("recovery.syntropy"):
+            new_sy = self.engine.calculate_syntropy_yield(0.1, new_efficiency, clean_data)
+
         duration = time.time() - start_time
+        if metrics.enabled:
+            metrics.histogram("recovery.heal").observe(duration)
+        metrics.inc("recovery.heals")
         
         healing_event = {
             "recovery_id": f"REC-{int(start_time)}",
@@ -0,0 +1,53 @@
+import json
+
+REQUIRED_FIELDS = ("epoch", "status", "timestamp")
+
+
+def read_ledger(path):
+    """
+    Yields (line_number, entry) for every non-blank line of a JSONL ledger.
+    Lines that are not valid JSON are yielded with entry=None.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except json.JSONDecodeError:
+                yield line_number, None
+
+
+def verify_ledger(path):
+    """
+    Checks that every ledger line is a JSON object carrying a 64-character
+    hex epoch, a status and a timestamp.
+
+    Returns:
+        dict: 'entries', 'committed' and a list of (line_number, reason) 'errors'.
+    """
+    report = {"entries": 0, "committed": 0, "errors": []}
+    for line_number, entry in read_ledger(path):
+        report["entries"] += 1
+        if not isinstance(entry, dict):
+            report["errors"].append((line_number, "MALFORMED_JSON"))
+            continue
+        missing = [field for field in REQUIRED_FIELDS if field not in entry]
+        if missing:
+            report["errors"].append((line_number, f"MISSING_FIELDS: {', '.join(missing)}"))
+            continue
+        epoch = entry["epoch"]
+        if not isinstance(epoch, str) or len(epoch) != 64 or not _is_hex(epoch):
+            report["errors"].append((line_number, "INVALID_EPOCH"))
+            continue
+        if entry["status"] == "COMMITTED":
+            report["committed"] += 1
+    return report
+
+
+def _is_hex(value):
+    try:
+        int(value, 16)
+    except ValueError:
+        return False
+    return True
@@ -0,0 +1,128 @@
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+
+LOG_FORMAT = '[%(asctime)s] %(levelname)s: %(message)s'
+ROOT_LOGGER = "nexus"
+
+_listener = None
+_queue_handler = None
+_config_lock = threading.Lock()
+
+# Until configure() runs, records are dropped here rather than reaching
+# logging.lastResort, which would write them synchronously to stderr
+logging.getLogger(ROOT_LOGGER).addHandler(logging.NullHandler())
+
+
+def get_logger(name=None):
+    """
+    Returns a logger under the 'nexus' namespace. Only a NullHandler is
+    installed here; records only go anywhere once `configure` has been called.
+    """
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}" if name else ROOT_LOGGER)
+
+
+class EventSamplingFilter(logging.Filter):
+    """
+    Keeps 1 in N records per event type. The event type is taken from the
+    record's `event` attribute (pass it via `extra={"event": ...}`); records
+    without one, or with no configured rate, always pass.
+    """
+
+    def __init__(self, rates=None):
+        super().__init__()
+        self.rates = dict(rates or {})
+        self.seen = {}
+        self.lock = threading.Lock()
+
+    def filter(self, record):
+        event = getattr(record, "event", None)
+        rate = self.rates.get(event)
+        if not rate or rate <= 1:
+            return True
+        with self.lock:
+            count = self.seen.get(event, 0)
+            self.seen[event] = count + 1
+        return count % rate == 0
+
+
+def parse_sample_rates(spec):
+    """
+    Parses 'DEFENSE_STABLE=100,GATE_CLOSED=10' into {'DEFENSE_STABLE': 100, ...}.
+    """
+    rates = {}
+    for item in (spec or "").split(","):
+        if not item.strip():
+            continue
+        event, _, rate = item.partition("=")
+        try:
+            rates[event.strip()] = int(rate)
+        except ValueError:
+            raise ValueError(f"Invalid log sample rate: {item!r}")
+    return rates
+
+
+def configure(level=None, log_path="nexus_core.log", stream=True, sample_rates=None):
+    """
+    Routes all 'nexus.*' records through a queue to a background writer thread
+    feeding the stream and/or file handlers. Safe to call more than once; later
+    calls replace the previous pipeline.
+
+    Level and sampling default to NEXUS_LOG_LEVEL and NEXUS_LOG_SAMPLE.
+    """
+    global _listener, _queue_handler
+
+    if level is None:
+        level = os.getenv("NEXUS_LOG_LEVEL", "INFO").upper()
+    if sample_rates is None:
+        sample_rates = parse_sample_rates(os.getenv("NEXUS_LOG_SAMPLE", ""))
+
+    handlers = []
+    if stream:
+        handlers.append(logging.StreamHandler())
+    if log_path:
+        handlers.append(logging.FileHandler(log_path))
+    formatter = logging.Formatter(LOG_FORMAT)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    with _config_lock:
+        _shutdown_locked()
+        log_queue = queue.SimpleQueue()
+        _queue_handler = logging.handlers.QueueHandler(log_queue)
+        # Sampling runs before QueueHandler.prepare, so dropped records are never formatted
+        _queue_handler.addFilter(EventSamplingFilter(sample_rates))
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+
+        logger = logging.getLogger(ROOT_LOGGER)
+        logger.setLevel(level)
+        logger.addHandler(_queue_handler)
+        logger.propagate = False
+    return _listener
+
+
+def shutdown():
+    """
+    Flushes queued records and stops the background writer.
+    """
+    with _config_lock:
+        _shutdown_locked()
+
+
+def _shutdown_locked():
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger(ROOT_LOGGER).removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(shutdown)
@@ -0,0 +1,281 @@
+"""
+Merkle-batched epochs.
+
+Committed epoch ids are grouped into fixed-size blocks and each block's
+Merkle root is persisted as one JSONL line of the blocks file. An inclusion
+proof for an epoch is the list of sibling hashes on its path to the block
+root, so verifying it takes O(log n) SHA3-256 calls and no ledger access.
+
+Leaves and interior nodes are hashed with distinct prefixes (as in RFC 6962)
+and an unpaired node is promoted to the next level unchanged, so a proof
+never needs the leaf index to be verified.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+from nexus import log as nexus_log
+
+logger = nexus_log.get_logger("merkle")
+
+DEFAULT_BLOCK_SIZE = 1024
+
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+
+def leaf_hash(epoch_id):
+    return hashlib.sha3_256(_LEAF_PREFIX + epoch_id.encode("utf-8")).hexdigest()
+
+
+def node_hash(left, right):
+    return hashlib.sha3_256(_NODE_PREFIX + bytes.fromhex(left) + bytes.fromhex(right)).hexdigest()
+
+
+def _levels(epoch_ids):
+    level = [leaf_hash(epoch_id) for epoch_id in epoch_ids]
+    levels = [level]
+    while len(level) > 1:
+        level = [node_hash(level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+                 for i in range(0, len(level), 2)]
+        levels.append(level)
+    return levels
+
+
+def merkle_root(epoch_ids):
+    if not epoch_ids:
+        raise ValueError("Cannot compute the Merkle root of an empty block.")
+    return _levels(epoch_ids)[-1][0]
+
+
+def build_proof(epoch_ids, index):
+    """
+    Returns the audit path for `epoch_ids[index]`: a list of
+    {'hash': sibling, 'side': 'left'|'right'} steps from leaf to root.
+    """
+    path = []
+    for level in _levels(epoch_ids)[:-1]:
+        sibling = index ^ 1
+        if sibling < len(level):
+            path.append({"hash": level[sibling], "side": "left" if sibling < index else "right"})
+        index //= 2
+    return path
+
+
+def verify_proof(proof, trusted_root):
+    """
+    Checks an inclusion proof produced by `BlockStore.prove` in O(log n).
+
+    The root carried inside the proof is never trusted on its own: anyone can
+    build a path to a root of their choosing, so the caller must supply the
+    block root it already trusts (e.g. from its own copy of the blocks file).
+
+    Returns:
+        bool: True when the epoch hashes up to `trusted_root`; always False
+        if no trusted root is given.
+    """
+    if not trusted_root or proof.get("root", trusted_root) != trusted_root:
+        return False
+    try:
+        node = leaf_hash(proof["epoch"])
+        for step in proof["path"]:
+            node = node_hash(step["hash"], node) if step["side"] == "left" else node_hash(node, step["hash"])
+    except (KeyError, TypeError, ValueError):
+        return False
+    return node == trusted_root
+
+
+def _find_last(f, needle, end, chunk_size=65536):
+    """
+    Byte offset of the last occurrence of `needle` before `end` in the binary
+    file `f`, or -1. Reads backwards in chunks, so the cost is proportional to
+    the distance from `end`, not to the file size.
+    """
+    pos, carry = end, b""
+    while pos > 0:
+        start = max(0, pos - chunk_size)
+        f.seek(start)
+        data = f.read(pos - start) + carry
+        index = data.rfind(needle)
+        if index != -1:
+            return start + index
+        carry = data[:len(needle) - 1]
+        pos = start
+    return -1
+
+
+class EpochBlockBuilder:
+    """
+    Collects committed epochs and seals them into Merkle blocks of
+    `block_size`, appending {'block', 'root', 'size', 'epochs'} per block to
+    `blocks_path`. `add` matches the NexusCore ledger listener signature.
+    """
+
+    def __init__(self, blocks_path="nexus_blocks.json", block_size=DEFAULT_BLOCK_SIZE):
+        self.blocks_path = blocks_path
+        self.block_size = block_size
+        self.pending = []
+        self.lock = threading.Lock()
+        last_block = self._load_last_block()
+        self.next_block = last_block["block"] + 1 if last_block else 0
+        self.last_sealed = last_block["epochs"][-1] if last_block else None
+
+    def add(self, entry):
+        if entry.get("status") != "COMMITTED":
+            return None
+        with self.lock:
+            self.pending.append(entry["epoch"])
+            if len(self.pending) >= self.block_size:
+                return self._seal()
+        return None
+
+    def flush(self):
+        """
+        Seals any pending epochs into a (short) block. Returns the block or None.
+        """
+        with self.lock:
+            return self._seal() if self.pending else None
+
+    def recover(self, ledger_path):
+        """
+        Seals the committed epochs of `ledger_path` that come after the last
+        sealed one, e.g. epochs still pending when a previous process died.
+        The ledger is searched backwards from its end, so a restart only reads
+        the unsealed tail. Returns the number of epochs sealed.
+        """
+        if not os.path.exists(ledger_path):
+            return 0
+        recovered = 0
+        with open(ledger_path, "rb") as f:
+            start = 0
+            if self.last_sealed is not None:
+                found = _find_last(f, self.last_sealed.encode("ascii"), f.seek(0, os.SEEK_END))
+                if found == -1:
+                    logger.warning("Last sealed epoch of %s is not in %s; not recovering unsealed epochs.",
+                                   self.blocks_path, ledger_path)
+                    return 0
+                f.seek(found)
+                f.readline()
+                start = f.tell()
+            f.seek(start)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # torn final line: its epoch was never committed
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict) and entry.get("status") == "COMMITTED" and "epoch" in entry:
+                    self.add(entry)
+                    recovered += 1
+        self.flush()
+        if recovered:
+            logger.info("Sealed %d epoch(s) left unsealed in %s.", recovered, ledger_path)
+        return recovered
+
+    def _load_last_block(self):
+        """
+        Reads the last block record, first truncating a torn line left by a
+        crash mid-append (its epochs are resealed by `recover`).
+        """
+        if not os.path.exists(self.blocks_path):
+            return None
+        with open(self.blocks_path, "rb+") as f:
+            size = f.seek(0, os.SEEK_END)
+            complete = _find_last(f, b"\n", size) + 1
+            if complete != size:
+                logger.warning("Truncating a torn block record at the end of %s.", self.blocks_path)
+                f.truncate(complete)
+            if complete == 0:
+                return None
+            line_start = _find_last(f, b"\n", complete - 1) + 1
+            f.seek(line_start)
+            return json.loads(f.read(complete - line_start))
+
+    def _seal(self):
+        block = {
+            "block": self.next_block,
+            "root": merkle_root(self.pending),
+            "size": len(self.pending),
+            "epochs": self.pending,
+        }
+        with open(self.blocks_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(block) + "\n")
+        self.next_block += 1
+        self.last_sealed = self.pending[-1]
+        self.pending = []
+        return block
+
+
+def build_blocks_from_ledger(ledger_path, blocks_path, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Seals every committed epoch of an existing ledger into `blocks_path`
+    (replacing it). Returns the number of blocks written.
+    """
+    from nexus.ledger import read_ledger
+
+    if os.path.exists(blocks_path):
+        os.remove(blocks_path)
+    builder = EpochBlockBuilder(blocks_path, block_size)
+    for _, entry in read_ledger(ledger_path):
+        if isinstance(entry, dict) and "epoch" in entry:
+            builder.add(entry)
+    builder.flush()
+    return builder.next_block
+
+
+class BlockStore:
+    """
+    Read side of the blocks file: maps epoch ids to their block and produces
+    compact inclusion proofs.
+    """
+
+    def __init__(self, blocks_path="nexus_blocks.json"):
+        self.blocks_path = blocks_path
+        self.roots = []          # block number -> Merkle root
+        self.offsets = []        # block number -> byte offset of its line
+        self.epoch_index = {}    # epoch id -> (block number, leaf index)
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.blocks_path):
+            return
+        with open(self.blocks_path, "rb") as f:
+            while True:
+                offset = f.tell()
+                line = f.readline()
+                if not line.endswith(b"\n"):
+                    break  # end of file, or a torn record from a crash mid-append
+                if not line.strip():
+                    continue
+                block = json.loads(line)
+                number = len(self.roots)
+                self.roots.append(block["root"])
+                self.offsets.append(offset)
+                for index, epoch_id in enumerate(block["epochs"]):
+                    self.epoch_index[epoch_id] = (number, index)
+
+    def _read_block(self, number):
+        with open(self.blocks_path, "rb") as f:
+            f.seek(self.offsets[number])
+            return json.loads(f.readline())
+
+    def prove(self, epoch_id):
+        """
+        Returns the inclusion proof for `epoch_id`, or None if it is not sealed.
+        """
+        location = self.epoch_index.get(epoch_id)
+        if location is None:
+            return None
+        number, index = location
+        block = self._read_block(number)
+        return {
+            "epoch": epoch_id,
+            "block": number,
+            "index": index,
+            "size": block["size"],
+            "root": block["root"],
+            "path": build_proof(block["epochs"], index),
+        }
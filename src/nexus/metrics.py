@@ -0,0 +1,247 @@
+import bisect
+import json
+import os
+import threading
+import time
+
+
+def _log_buckets(low=1e-6, high=10.0, steps_per_octave=4):
+    """
+    Builds HDR-style fixed bucket bounds: log-spaced upper bounds (in seconds)
+    with `steps_per_octave` sub-buckets per power of two, from `low` to `high`.
+    """
+    bounds = []
+    factor = 2 ** (1.0 / steps_per_octave)
+    bound = low
+    while bound < high:
+        bounds.append(bound)
+        bound *= factor
+    bounds.append(high)
+    return tuple(bounds)
+
+
+DEFAULT_BUCKETS = _log_buckets()
+
+
+class Histogram:
+    """
+    Fixed-bucket latency histogram. Recording is a bisect plus two additions,
+    so it is cheap enough to sit on the transaction hot path.
+    """
+
+    def __init__(self, name, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last slot is the +Inf overflow
+        self.count = 0
+        self.sum = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, value):
+        idx = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            self.counts[idx] += 1
+            self.count += 1
+            self.sum += value
+
+    def percentile(self, q):
+        """
+        Returns the upper bound of the bucket holding the q-th percentile
+        (0 < q <= 100), or 0.0 when nothing has been recorded.
+        """
+        with self.lock:
+            counts = list(self.counts)
+            total = self.count
+        if total == 0:
+            return 0.0
+        rank = max(1, int(round(total * q / 100.0)))
+        seen = 0
+        for idx, bucket_count in enumerate(counts):
+            seen += bucket_count
+            if seen >= rank:
+                return self.buckets[idx] if idx < len(self.buckets) else float("inf")
+        return float("inf")
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "count": self.count,
+                "sum": self.sum,
+                "buckets": dict(zip(self.buckets, self.counts)),
+                "overflow": self.counts[-1],
+            }
+
+
+class Counter:
+    def __init__(self, name):
+        self.name = name
+        self.value = 0
+        self.lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self.lock:
+            self.value += amount
+
+
+class _StageTimer:
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, histogram):
+        self.histogram = histogram
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.histogram.observe(time.perf_counter() - self.start)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class MetricsRegistry:
+    """
+    In-process registry of per-stage latency histograms and event counters.
+    When disabled, `time` returns a shared no-op context manager and `inc`
+    returns immediately, so instrumented code pays a single attribute check.
+    """
+
+    def __init__(self, enabled=False, buckets=DEFAULT_BUCKETS):
+        self.enabled = enabled
+        self.buckets = buckets
+        self.histograms = {}
+        self.counters = {}
+        self.lock = threading.Lock()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self.lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+    def histogram(self, stage):
+        hist = self.histograms.get(stage)
+        if hist is None:
+            with self.lock:
+                hist = self.histograms.setdefault(stage, Histogram(stage, self.buckets))
+        return hist
+
+    def counter(self, event):
+        counter = self.counters.get(event)
+        if counter is None:
+            with self.lock:
+                counter = self.counters.setdefault(event, Counter(event))
+        return counter
+
+    def time(self, stage):
+        """
+        Context manager recording the wall time of the enclosed block under `stage`.
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _StageTimer(self.histogram(stage))
+
+    def inc(self, event, amount=1):
+        if not self.enabled:
+            return
+        self.counter(event).inc(amount)
+
+    def to_dict(self):
+        return {
+            "stages": {
+                stage: {
+                    "count": hist.count,
+                    "sum_seconds": hist.sum,
+                    "p50_seconds": hist.percentile(50),
+                    "p99_seconds": hist.percentile(99),
+                    "p999_seconds": hist.percentile(99.9),
+                }
+                for stage, hist in sorted(self.histograms.items())
+            },
+            "events": {event: counter.value for event, counter in sorted(self.counters.items())},
+        }
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self):
+        """
+        Renders the registry in the Prometheus text exposition format.
+        """
+        lines = [
+            "# HELP nexus_stage_duration_seconds Wall time spent per pipeline stage.",
+            "# TYPE nexus_stage_duration_seconds histogram",
+        ]
+        for stage, hist in sorted(self.histograms.items()):
+            snap = hist.snapshot()
+            cumulative = 0
+            for bound, bucket_count in snap["buckets"].items():
+                cumulative += bucket_count
+                lines.append(f'nexus_stage_duration_seconds_bucket{{stage="{stage}",le="{bound:.9g}"}} {cumulative}')
+            lines.append(f'nexus_stage_duration_seconds_bucket{{stage="{stage}",le="+Inf"}} {snap["count"]}')
+            lines.append(f'nexus_stage_duration_seconds_sum{{stage="{stage}"}} {snap["sum"]:.9g}')
+            lines.append(f'nexus_stage_duration_seconds_count{{stage="{stage}"}} {snap["count"]}')
+        lines.append("# HELP nexus_events_total Pipeline events (commits, rejections, slashes, ...).")
+        lines.append("# TYPE nexus_events_total counter")
+        for event, counter in sorted(self.counters.items()):
+            lines.append(f'nexus_events_total{{event="{event}"}} {counter.value}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, path, fmt="prometheus"):
+        """
+        Writes a snapshot to `path` in either 'prometheus' or 'json' format.
+        """
+        if fmt not in ("prometheus", "json"):
+            raise ValueError(f"Unknown metrics format: {fmt}")
+        payload = self.to_prometheus() if fmt == "prometheus" else self.to_json()
+        # Replace atomically so a scraper never reads a half-written snapshot
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+
+
+def export_on_signal(path, fmt="prometheus", metrics=None, signum=None):
+    """
+    Dumps `metrics` (default: the shared registry) to `path` whenever the
+    process receives `signum` (default: SIGUSR1). Returns the previous
+    handler, or None where the signal is unavailable or this is not the
+    main thread.
+    """
+    import signal
+
+    metrics = metrics if metrics is not None else registry
+    signum = signum if signum is not None else getattr(signal, "SIGUSR1", None)
+    if signum is None:
+        return None
+
+    def handler(*_):
+        # Export from a thread: the handler may interrupt code holding a histogram lock
+        threading.Thread(target=metrics.export, args=(path, fmt), name="metrics-export", daemon=True).start()
+
+    try:
+        return signal.signal(signum, handler)
+    except ValueError:
+        return None
+
+
+# Shared registry; enabled with NEXUS_METRICS=1 or registry.enable()
+registry = MetricsRegistry(enabled=os.getenv("NEXUS_METRICS", "").lower() in ("1", "true", "yes"))
@@ -0,0 +1,289 @@
+"""
+Deterministic trace recording and replay for capacity planning.
+
+A trace is a gzip-compressed JSONL file: one header object followed by one
+compact array per event, each carrying the nanoseconds elapsed since the
+previous event:
+
+    ["tx", dt_ns, user_id, payload, signals]
+    ["register", dt_ns, user_id]
+    ["stake", dt_ns, user_id, amount, thermodynamic_cost, anchor_id]
+
+The header carries the live gate's weights and bias and a snapshot of the
+Sequencer at the moment recording started, so replay starts from the same
+state and makes the same commit/reject decisions as production.
+Epoch entropy and the clock, which do not affect decisions, come from a
+seeded generator and a virtual clock, so the same trace and seed always
+produce byte-identical ledgers and Sequencer state.
+"""
+
+import gzip
+import json
+import os
+import threading
+import time
+
+import numpy as np
+
+from nexus import log as nexus_log
+from nexus.core import NexusCore
+
+logger = nexus_log.get_logger("replay")
+
+TRACE_VERSION = 1
+
+
+def _to_json(value):
+    # NumPy scalars and arrays commonly end up in payloads and stakes
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class TraceRecorder:
+    """
+    Records every transaction, registration and stake made through an
+    attached NexusCore. Calls are serialized while recording so the trace
+    order is exactly the order the core processed them in.
+
+    Recording never fails a live call: an event that cannot be encoded is
+    logged, counted in `skipped` and left out of the trace.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.events = 0
+        self.skipped = 0
+        self.lock = threading.Lock()
+        self._file = None
+        self._last_ns = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def attach(self, nexus):
+        with nexus.gate.lock:
+            weights, bias = nexus.gate.weights.tolist(), float(nexus.gate.bias)
+        self._file = gzip.open(self.path, "wt", encoding="utf-8")
+        self._write({
+            "type": "header",
+            "version": TRACE_VERSION,
+            "threshold": nexus.threshold,
+            "input_dim": len(weights),
+            "weights": weights,
+            "bias": bias,
+            "sequencer": sequencer_state(nexus.sequencer),
+            "start_ns": time.time_ns(),
+        })
+        self._last_ns = time.perf_counter_ns()
+
+        process_transaction = nexus.process_transaction
+        register_user = nexus.sequencer.register_user
+        stake_tokens = nexus.sequencer.stake_tokens
+
+        def recorded_process_transaction(signals, data, user_id=None):
+            with self.lock:
+                self._event("tx", user_id, data, np.asarray(signals, dtype=np.float64).tolist())
+                return process_transaction(signals, data, user_id)
+
+        def recorded_register_user(user_id):
+            with self.lock:
+                self._event("register", user_id)
+                return register_user(user_id)
+
+        def recorded_stake_tokens(user_id, amount, thermodynamic_cost=1.0, anchor_id=None):
+            with self.lock:
+                self._event("stake", user_id, amount, thermodynamic_cost, anchor_id)
+                return stake_tokens(user_id, amount, thermodynamic_cost, anchor_id)
+
+        nexus.process_transaction = recorded_process_transaction
+        nexus.sequencer.register_user = recorded_register_user
+        nexus.sequencer.stake_tokens = recorded_stake_tokens
+        return self
+
+    def close(self):
+        with self.lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _event(self, kind, *fields):
+        if self._file is None:
+            return
+        now = time.perf_counter_ns()
+        try:
+            line = self._encode([kind, now - self._last_ns, *fields])
+        except (TypeError, ValueError) as e:
+            self.skipped += 1
+            logger.warning("Not recording %s event: %s", kind, e)
+            return
+        self._file.write(line)
+        self._last_ns = now
+        self.events += 1
+
+    def _write(self, record):
+        self._file.write(self._encode(record))
+
+    @staticmethod
+    def _encode(record):
+        return json.dumps(record, separators=(",", ":"), default=_to_json) + "\n"
+
+
+def read_trace(path):
+    """
+    Returns (header, events) where events is an iterator over the trace records.
+    """
+    f = gzip.open(path, "rt", encoding="utf-8")
+    header = json.loads(f.readline())
+    if header.get("type") != "header" or header.get("version") != TRACE_VERSION:
+        f.close()
+        raise ValueError(f"{path} is not a version {TRACE_VERSION} Nexus trace.")
+
+    def events():
+        with f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    return header, events()
+
+
+class VirtualClock:
+    """
+    Nanosecond clock that only moves when the replay advances it.
+    """
+
+    def __init__(self, start_ns):
+        self.now_ns = start_ns
+
+    def __call__(self):
+        return self.now_ns
+
+    def advance(self, delta_ns):
+        self.now_ns += delta_ns
+
+
+def sequencer_state(sequencer):
+    return {
+        "users": sequencer.users,
+        "reputation_scores": sequencer.reputation_scores,
+        "anchor_log": sequencer.anchor_log,
+    }
+
+
+def replay_trace(trace_path, ledger_path, seed=0, speed=None, threshold=None, state_path=None):
+    """
+    Replays a trace through a fresh, deterministically seeded NexusCore.
+
+    Args:
+        trace_path (str): Trace written by TraceRecorder.
+        ledger_path (str): Ledger to (re)create for this replay.
+        seed (int): Seed for epoch entropy (and gate weights, if the trace
+            predates recorded weights).
+        speed (float): None or 0 replays as fast as possible; otherwise recorded
+            inter-arrival times are divided by `speed` (2.0 = twice as fast).
+        threshold (float): Overrides the threshold recorded in the trace header.
+        state_path (str): Optional path to write the final Sequencer state to.
+
+    Returns:
+        dict: Event counts, commit/reject totals, wall time, throughput and
+        the final Sequencer state.
+    """
+    header, events = read_trace(trace_path)
+    if os.path.exists(ledger_path):
+        os.remove(ledger_path)
+
+    rng = np.random.default_rng(seed)
+    clock = VirtualClock(header["start_ns"])
+    nexus = NexusCore(
+        threshold=header["threshold"] if threshold is None else threshold,
+        ledger_path=ledger_path,
+        rng=rng,
+        entropy_source=lambda: rng.bytes(32).hex(),
+        clock=clock,
+    )
+    # Gate decisions depend only on these and the signals; older traces without them fall back to the seed
+    if "weights" in header:
+        nexus.gate.weights = np.array(header["weights"], dtype=np.float64)
+        nexus.gate.bias = header["bias"]
+    if "sequencer" in header:
+        nexus.sequencer.users = header["sequencer"]["users"]
+        nexus.sequencer.reputation_scores = header["sequencer"]["reputation_scores"]
+        nexus.sequencer.anchor_log = header["sequencer"]["anchor_log"]
+
+    counts = {"events": 0, "transactions": 0, "commits": 0, "rejects": 0}
+    schedule_ns = 0
+    started = time.perf_counter_ns()
+    for event in events:
+        kind, delta_ns = event[0], event[1]
+        clock.advance(delta_ns)
+        if speed:
+            schedule_ns += delta_ns / speed
+            lag_s = (started + schedule_ns - time.perf_counter_ns()) / 1e9
+            if lag_s > 0:
+                time.sleep(lag_s)
+
+        if kind == "tx":
+            _, _, user_id, payload, signals = event
+            success, _ = nexus.process_transaction(np.array(signals, dtype=np.float64), payload, user_id)
+            counts["transactions"] += 1
+            counts["commits" if success else "rejects"] += 1
+        elif kind == "register":
+            nexus.sequencer.register_user(event[2])
+        elif kind == "stake":
+            nexus.sequencer.stake_tokens(*event[2:])
+        else:
+            raise ValueError(f"Unknown trace event: {kind!r}")
+        counts["events"] += 1
+    elapsed = (time.perf_counter_ns() - started) / 1e9
+
+    state = sequencer_state(nexus.sequencer)
+    if state_path:
+        with open(state_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+
+    return dict(
+        counts,
+        elapsed_s=round(elapsed, 4),
+        throughput_tps=round(counts["transactions"] / elapsed, 2) if elapsed > 0 else 0.0,
+        sequencer=state,
+    )
+
+
+def diff_ledgers(path_a, path_b, limit=10):
+    """
+    Returns up to `limit` (line_number, line_a, line_b) differences; a missing
+    line on either side is reported as None. A missing file is an empty
+    ledger (a replay that committed nothing never creates one).
+    """
+    differences = []
+    paths = [path if os.path.exists(path) else os.devnull for path in (path_a, path_b)]
+    with open(paths[0], "r", encoding="utf-8") as a, open(paths[1], "r", encoding="utf-8") as b:
+        line_number = 0
+        while len(differences) < limit:
+            line_a, line_b = a.readline(), b.readline()
+            if not line_a and not line_b:
+                break
+            line_number += 1
+            if line_a != line_b:
+                differences.append((line_number, line_a.rstrip("\n") or None, line_b.rstrip("\n") or None))
+    return differences
+
+
+def diff_states(state_a, state_b):
+    """
+    Lists the users whose Sequencer state differs between two snapshots.
+    """
+    differences = []
+    for section in ("users", "reputation_scores", "anchor_log"):
+        a, b = state_a.get(section, {}), state_b.get(section, {})
+        for user_id in sorted(set(a) | set(b)):
+            if a.get(user_id) != b.get(user_id):
+                differences.append(f"{section}[{user_id}]: {a.get(user_id)!r} != {b.get(user_id)!r}")
+    return differences
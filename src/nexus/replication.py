@@ -0,0 +1,293 @@
+"""
+Ledger log shipping from a primary node to followers.
+
+The primary tails its JSONL ledger and streams complete lines to each
+follower in batches over a TCP socket. Followers append batches verbatim,
+fsync, and acknowledge the next offset they expect. Offsets count ledger
+entries (lines), so a reconnecting follower resumes by subscribing with the
+number of entries it already holds.
+
+Wire format: one JSON object per line.
+    follower -> primary  {"type": "subscribe", "node_id": ..., "offset": N}
+    primary -> follower  {"type": "batch", "offset": N, "entries": [line, ...]}
+    follower -> primary  {"type": "ack", "offset": N + len(entries)}
+    primary -> follower  {"type": "error", "reason": ...}
+"""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+
+from nexus import log as nexus_log
+
+logger = nexus_log.get_logger("replication")
+
+DEFAULT_PORT = 7447
+DEFAULT_BATCH_SIZE = 256
+
+
+class ReplicationError(Exception):
+    pass
+
+
+def config_from_env(environ=None):
+    """
+    Reads the node's replication settings from the environment.
+
+    NEXUS_NODE_ID decides the role unless NEXUS_REPLICATION_ROLE is set:
+    ids starting with 'PRIMARY' ship their ledger, all others follow.
+    A follower mirrors into NEXUS_REPLICA_PATH, kept apart from the
+    NEXUS_LEDGER_PATH its own engine writes to.
+    """
+    environ = os.environ if environ is None else environ
+    node_id = environ.get("NEXUS_NODE_ID", "PRIMARY-LOCAL")
+    role = environ.get("NEXUS_REPLICATION_ROLE") or ("primary" if node_id.upper().startswith("PRIMARY") else "follower")
+    return {
+        "node_id": node_id,
+        "role": role.lower(),
+        "threshold": float(environ.get("NEXUS_THRESHOLD", "2.0")),
+        "ledger_path": environ.get("NEXUS_LEDGER_PATH", "nexus_immutable_core.json"),
+        "replica_path": environ.get("NEXUS_REPLICA_PATH", "nexus_replica_core.json"),
+        "primary_host": environ.get("NEXUS_PRIMARY_HOST", "127.0.0.1"),
+        "bind_host": environ.get("NEXUS_REPLICATION_BIND", "127.0.0.1"),
+        "port": int(environ.get("NEXUS_REPLICATION_PORT", DEFAULT_PORT)),
+    }
+
+
+def _send(wfile, message):
+    wfile.write(json.dumps(message).encode("utf-8") + b"\n")
+    wfile.flush()
+
+
+def _recv(rfile):
+    line = rfile.readline()
+    if not line:
+        raise ConnectionError("Replication peer closed the connection.")
+    return json.loads(line)
+
+
+class _ShipperHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            hello = _recv(self.rfile)
+            if hello.get("type") != "subscribe":
+                _send(self.wfile, {"type": "error", "reason": "EXPECTED_SUBSCRIBE"})
+                return
+            self.server.shipper._serve_follower(str(hello["node_id"]), int(hello["offset"]), self.rfile, self.wfile)
+        except ReplicationError as e:
+            logger.error("%s", e)
+        except (ConnectionError, OSError, ValueError, KeyError) as e:
+            logger.warning("Follower connection from %s dropped: %s", self.client_address, e)
+
+
+class _ShipperServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class LedgerShipper:
+    """
+    Primary side: serves the ledger at `ledger_path` to any number of followers.
+    New appends are picked up by polling, or immediately when `notify` is
+    registered as a NexusCore ledger listener.
+    """
+
+    def __init__(self, ledger_path, host="127.0.0.1", port=DEFAULT_PORT, batch_size=DEFAULT_BATCH_SIZE,
+                 poll_interval=0.2):
+        self.ledger_path = ledger_path
+        self.host = host
+        self.port = port
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.acked = {}  # node_id: next offset the follower expects
+        self._appended = threading.Condition()
+        self._stopping = threading.Event()
+        self._server = None
+        self._thread = None
+
+    @property
+    def address(self):
+        return self._server.server_address if self._server else (self.host, self.port)
+
+    def start(self):
+        self._server = _ShipperServer((self.host, self.port), _ShipperHandler)
+        self._server.shipper = self
+        self._thread = threading.Thread(target=self._server.serve_forever, name="ledger-shipper", daemon=True)
+        self._thread.start()
+        logger.info("Ledger shipper serving %s on %s:%d", self.ledger_path, *self.address[:2])
+        return self
+
+    def stop(self):
+        self._stopping.set()
+        self.notify()
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def notify(self, entry=None):
+        """
+        Wakes follower streams after an append; usable as a ledger listener.
+        """
+        with self._appended:
+            self._appended.notify_all()
+
+    def wait_for_ack(self, node_id, offset, timeout=None):
+        """
+        Blocks until `node_id` has acknowledged `offset`. Returns False on timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._appended:
+            while self.acked.get(node_id, -1) < offset:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._appended.wait(remaining if remaining is not None else self.poll_interval)
+        return True
+
+    def _open_ledger(self):
+        while not self._stopping.is_set():
+            try:
+                return open(self.ledger_path, "rb")
+            except FileNotFoundError:
+                with self._appended:
+                    self._appended.wait(self.poll_interval)
+        return None
+
+    def _serve_follower(self, node_id, offset, rfile, wfile):
+        ledger = self._open_ledger()
+        if ledger is None:
+            return
+        with ledger:
+            # Catch-up: skip the entries the follower already holds
+            for _ in range(offset):
+                line = ledger.readline()
+                if not line.endswith(b"\n"):
+                    _send(wfile, {"type": "error", "reason": "OFFSET_AHEAD_OF_PRIMARY"})
+                    logger.error("Follower %s subscribed at offset %d, beyond the primary ledger.", node_id, offset)
+                    return
+            logger.info("Follower %s subscribed at offset %d.", node_id, offset)
+            self._set_acked(node_id, offset)
+
+            while not self._stopping.is_set():
+                batch = self._read_batch(ledger)
+                if not batch:
+                    with self._appended:
+                        self._appended.wait(self.poll_interval)
+                    continue
+                _send(wfile, {"type": "batch", "offset": offset, "entries": batch})
+                ack = _recv(rfile)
+                expected = offset + len(batch)
+                if ack.get("type") != "ack" or ack.get("offset") != expected:
+                    raise ReplicationError(f"Follower {node_id} acknowledged {ack!r}, expected offset {expected}.")
+                offset = expected
+                self._set_acked(node_id, offset)
+
+    def _read_batch(self, ledger):
+        batch = []
+        while len(batch) < self.batch_size:
+            position = ledger.tell()
+            line = ledger.readline()
+            if not line.endswith(b"\n"):
+                # Nothing new, or a writer is mid-line: retry from here later
+                ledger.seek(position)
+                break
+            batch.append(line[:-1].decode("utf-8"))
+        return batch
+
+    def _set_acked(self, node_id, offset):
+        with self._appended:
+            self.acked[node_id] = offset
+            self._appended.notify_all()
+
+
+class LedgerFollower:
+    """
+    Follower side: keeps `ledger_path` an exact, in-order copy of the primary
+    ledger, reconnecting and resuming from its own entry count after failures.
+    """
+
+    def __init__(self, ledger_path, node_id, host="127.0.0.1", port=DEFAULT_PORT, reconnect_interval=1.0):
+        self.ledger_path = ledger_path
+        self.node_id = node_id
+        self.host = host
+        self.port = port
+        self.reconnect_interval = reconnect_interval
+        self.offset = self._recover_offset()
+        self.error = None  # Set when the primary rejects this follower; streaming stops
+        self._stopping = threading.Event()
+        self._socket = None
+        self._thread = None
+
+    def _recover_offset(self):
+        """
+        Counts complete entries on disk, truncating a torn final line left by
+        a crash mid-append so the primary can resend it.
+        """
+        if not os.path.exists(self.ledger_path):
+            return 0
+        with open(self.ledger_path, "rb+") as f:
+            data = f.read()
+            complete = data.rfind(b"\n") + 1
+            if complete != len(data):
+                f.truncate(complete)
+        return data.count(b"\n", 0, complete)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, name=f"ledger-follower-{self.node_id}", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopping.set()
+        sock = self._socket
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        if self._thread:
+            self._thread.join()
+
+    def run(self):
+        while not self._stopping.is_set():
+            try:
+                self._stream()
+            except ReplicationError as e:
+                logger.error("Replication halted for %s: %s", self.node_id, e)
+                self.error = e
+                self._stopping.set()
+                break
+            except (ConnectionError, OSError, ValueError) as e:
+                if self._stopping.is_set():
+                    break
+                logger.warning("Replication link to %s:%d lost (%s); retrying.", self.host, self.port, e)
+            self._stopping.wait(self.reconnect_interval)
+
+    def _stream(self):
+        with socket.create_connection((self.host, self.port)) as sock:
+            self._socket = sock
+            try:
+                rfile, wfile = sock.makefile("rb"), sock.makefile("wb")
+                _send(wfile, {"type": "subscribe", "node_id": self.node_id, "offset": self.offset})
+                while not self._stopping.is_set():
+                    message = _recv(rfile)
+                    if message.get("type") == "error":
+                        raise ReplicationError(f"Primary refused subscription: {message.get('reason')}")
+                    if message.get("offset") != self.offset:
+                        raise ConnectionError(f"Out-of-order batch at {message.get('offset')}, expected {self.offset}.")
+                    self._apply(message["entries"])
+                    _send(wfile, {"type": "ack", "offset": self.offset})
+            finally:
+                self._socket = None
+
+    def _apply(self, entries):
+        with open(self.ledger_path, "ab") as f:
+            f.write("".join(entry + "\n" for entry in entries).encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        self.offset += len(entries)
@@ -0,0 +1,285 @@
+"""
+Process-sharded NexusCore runtime.
+
+Transactions are partitioned by user_id across worker processes. Each shard
+owns a full NexusCore: its own gate, the Sequencer partition for its users
+and its own ledger segment. The coordinator routes requests over pipes, ships
+signal batches through per-shard shared-memory buffers, merges leaderboards
+and exposes a globally ordered view of the segmented ledger.
+"""
+
+import heapq
+import itertools
+import json
+import multiprocessing
+import os
+import threading
+import zlib
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from nexus import log as nexus_log
+
+logger = nexus_log.get_logger("sharding")
+
+DEFAULT_BATCH_CAPACITY = 4096
+
+
+class ShardError(Exception):
+    pass
+
+
+def _shard_worker(index, conn, ledger_path, threshold, shm_name, batch_capacity, input_dim, seed):
+    from nexus.core import NexusCore
+
+    rng = np.random.default_rng(seed + index) if seed is not None else None
+    nexus = NexusCore(threshold=threshold, ledger_path=ledger_path, rng=rng)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    batch = np.ndarray((batch_capacity, input_dim), dtype=np.float64, buffer=shm.buf)
+    try:
+        while True:
+            op, args = conn.recv()
+            if op == "stop":
+                conn.send(("ok", None))
+                break
+            try:
+                if op == "process":
+                    reply = nexus.process_transaction(*args)
+                elif op == "process_batch":
+                    count, payloads, user_ids = args
+                    reply = [nexus.process_transaction(batch[i], payloads[i], user_ids[i]) for i in range(count)]
+                elif op == "register_user":
+                    reply = nexus.sequencer.register_user(*args)
+                elif op == "stake_tokens":
+                    reply = nexus.sequencer.stake_tokens(*args)
+                elif op == "scores":
+                    reply = dict(nexus.sequencer.display_scores())
+                elif op == "stake_history":
+                    reply = nexus.sequencer.display_stake_history(*args)
+                else:
+                    raise ValueError(f"Unknown shard operation: {op}")
+                conn.send(("ok", reply))
+            except Exception as e:
+                conn.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        del batch
+        shm.close()
+        conn.close()
+
+
+class _Shard:
+    def __init__(self, index, ledger_path, threshold, batch_capacity, input_dim, seed, context):
+        self.index = index
+        self.ledger_path = ledger_path
+        self.lock = threading.Lock()
+        self.shm = shared_memory.SharedMemory(create=True, size=batch_capacity * input_dim * 8)
+        self.batch = np.ndarray((batch_capacity, input_dim), dtype=np.float64, buffer=self.shm.buf)
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_shard_worker,
+            args=(index, child_conn, ledger_path, threshold, self.shm.name, batch_capacity, input_dim, seed),
+            name=f"nexus-shard-{index}",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+
+    def send(self, op, *args):
+        try:
+            self.conn.send((op, args))
+        except (EOFError, OSError) as e:
+            raise ShardError(f"Shard {self.index}: worker unavailable ({type(e).__name__}: {e})") from e
+
+    def receive(self):
+        try:
+            status, reply = self.conn.recv()
+        except (EOFError, OSError) as e:
+            raise ShardError(f"Shard {self.index}: worker unavailable ({type(e).__name__}: {e})") from e
+        if status != "ok":
+            raise ShardError(f"Shard {self.index}: {reply}")
+        return reply
+
+    def call(self, op, *args):
+        with self.lock:
+            self.send(op, *args)
+            return self.receive()
+
+    def close(self):
+        try:
+            if self.process.is_alive():
+                self.call("stop")
+        except ShardError:
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.conn.close()
+        del self.batch
+        self.shm.close()
+        self.shm.unlink()
+
+
+class ShardedNexus:
+    """
+    Coordinator for `shards` NexusCore worker processes (default: one per CPU).
+    """
+
+    def __init__(self, shards=None, threshold=2.0, ledger_dir="nexus_shards", batch_capacity=DEFAULT_BATCH_CAPACITY,
+                 input_dim=5, seed=None, start_method=None):
+        self.num_shards = shards or os.cpu_count() or 1
+        self.threshold = threshold
+        self.ledger_dir = ledger_dir
+        self.batch_capacity = batch_capacity
+        self.input_dim = input_dim
+        self.seed = seed
+        self.context = multiprocessing.get_context(start_method)
+        self.shards = []
+        self._round_robin = itertools.count()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    @property
+    def ledger_paths(self):
+        return [os.path.join(self.ledger_dir, f"shard-{i:03d}.json") for i in range(self.num_shards)]
+
+    def start(self):
+        os.makedirs(self.ledger_dir, exist_ok=True)
+        for index, ledger_path in enumerate(self.ledger_paths):
+            self.shards.append(_Shard(index, ledger_path, self.threshold, self.batch_capacity, self.input_dim,
+                                      self.seed, self.context))
+        logger.info("Started %d NexusCore shards under %s", self.num_shards, self.ledger_dir)
+        return self
+
+    def close(self):
+        for shard in self.shards:
+            shard.close()
+        self.shards = []
+
+    def shard_for(self, user_id):
+        """
+        Stable user_id -> shard mapping; anonymous transactions are spread round-robin.
+        """
+        if user_id is None:
+            return next(self._round_robin) % self.num_shards
+        return zlib.crc32(str(user_id).encode("utf-8")) % self.num_shards
+
+    def register_user(self, user_id):
+        self.shards[self.shard_for(user_id)].call("register_user", user_id)
+
+    def stake_tokens(self, user_id, amount, thermodynamic_cost=1.0, anchor_id=None):
+        self.shards[self.shard_for(user_id)].call("stake_tokens", user_id, amount, thermodynamic_cost, anchor_id)
+
+    def display_stake_history(self, user_id):
+        return self.shards[self.shard_for(user_id)].call("stake_history", user_id)
+
+    def process_transaction(self, signals, data, user_id=None):
+        return tuple(self.shards[self.shard_for(user_id)].call("process", np.asarray(signals), data, user_id))
+
+    def process_batch(self, signals, data, user_ids=None):
+        """
+        Processes a (n, input_dim) block of signals, fanning rows out to their
+        shards in parallel. `data` is one payload for every row or a list of n.
+
+        Returns:
+            list: (success, result) per row, in input order.
+        """
+        signals = np.asarray(signals, dtype=np.float64)
+        count = len(signals)
+        payloads = data if isinstance(data, list) else [data] * count
+        user_ids = user_ids if user_ids is not None else [None] * count
+
+        rows_by_shard = {}
+        for row, user_id in enumerate(user_ids):
+            rows_by_shard.setdefault(self.shard_for(user_id), []).append(row)
+
+        results = [None] * count
+        # Chunk so every shard's slice fits its shared-memory buffer
+        pending = {index: rows for index, rows in rows_by_shard.items()}
+        while pending:
+            locked, sent, errors = [], [], []
+            try:
+                # Shard locks are always taken in ascending index order, so concurrent batches cannot deadlock
+                for index, rows in sorted(pending.items()):
+                    chunk, rest = rows[:self.batch_capacity], rows[self.batch_capacity:]
+                    shard = self.shards[index]
+                    shard.lock.acquire()
+                    locked.append(shard)
+                    shard.batch[:len(chunk)] = signals[chunk]
+                    shard.send("process_batch", len(chunk), [payloads[r] for r in chunk], [user_ids[r] for r in chunk])
+                    sent.append((shard, chunk))
+                    if rest:
+                        pending[index] = rest
+                    else:
+                        del pending[index]
+            except ShardError as e:
+                errors.append(e)
+            finally:
+                # Collect every reply that was requested, even after a failure, so no pipe keeps a stale reply
+                for shard, chunk in sent:
+                    try:
+                        for row, outcome in zip(chunk, shard.receive()):
+                            results[row] = tuple(outcome)
+                    except ShardError as e:
+                        errors.append(e)
+                for shard in locked:
+                    shard.lock.release()
+            if errors:
+                raise errors[0]
+        return results
+
+    def display_scores(self):
+        """
+        Reputation scores merged across all shards.
+        """
+        merged = {}
+        locked, sent, errors = [], [], []
+        try:
+            for shard in self.shards:
+                shard.lock.acquire()
+                locked.append(shard)
+                shard.send("scores")
+                sent.append(shard)
+        except ShardError as e:
+            errors.append(e)
+        finally:
+            for shard in sent:
+                try:
+                    merged.update(shard.receive())
+                except ShardError as e:
+                    errors.append(e)
+            for shard in locked:
+                shard.lock.release()
+        if errors:
+            raise errors[0]
+        return merged
+
+    def compete(self):
+        """
+        Global top 3 users by reputation, as Sequencer.compete but over every shard.
+        """
+        winners = sorted(self.display_scores().items(), key=lambda item: item[1], reverse=True)
+        return [user[0] for user in winners[:3]]
+
+    def merged_ledger(self):
+        """
+        Yields every shard's ledger entries as one stream ordered by commit
+        timestamp, ties broken by shard index. Each entry gains a 'shard' key.
+        """
+        def segment(index, path):
+            if not os.path.exists(path):
+                return
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        entry["shard"] = index
+                        yield entry
+
+        streams = [segment(i, path) for i, path in enumerate(self.ledger_paths)]
+        yield from heapq.merge(*streams, key=lambda entry: (entry.get("timestamp", ""), entry["shard"]))
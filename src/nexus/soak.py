@@ -0,0 +1,211 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+from array import array
+
+# Default regression thresholds, relative to the stored baseline
+DEFAULT_TOLERANCE = 0.20        # 20% throughput drop or latency rise
+DEFAULT_RATIO_TOLERANCE = 0.05  # 5 percentage points of commit-ratio drift
+
+
+def _rss_bytes():
+    """
+    Current resident set size of this process, or 0 where it cannot be read.
+    """
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+        # ru_maxrss is the peak, in KiB on Linux and bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except (ImportError, OSError):
+        return 0
+
+
+def _file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _percentile_ms(sorted_latencies, q):
+    if not sorted_latencies:
+        return 0.0
+    idx = min(len(sorted_latencies) - 1, int(len(sorted_latencies) * q / 100.0))
+    return round(sorted_latencies[idx] * 1000, 4)
+
+
+def run_soak(duration=None, transactions=None, concurrency=1, threshold=2.0, ledger_path=None,
+             sample_interval=1.0, users=16, seed=0):
+    """
+    Drives NexusCore under sustained load until `duration` seconds elapse or
+    `transactions` have been processed (whichever is given; both may be).
+    The gate weights and signal streams are seeded so that runs compare
+    like-for-like against a baseline.
+
+    Returns:
+        dict: Throughput, latency percentiles, commit/reject ratios and a
+        timeline of RSS and ledger size samples.
+    """
+    if duration is None and transactions is None:
+        raise ValueError("run_soak needs a duration, a transaction count, or both.")
+
+    # Imported here so that building the CLI parser does not pull in NumPy
+    import numpy as np
+
+    from nexus.core import NexusCore
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger_path = ledger_path or os.path.join(tmp, "soak_ledger.json")
+        nexus = NexusCore(threshold=threshold, ledger_path=ledger_path, rng=np.random.default_rng(seed))
+        user_ids = [f"soak-{i}" for i in range(users)]
+        for user_id in user_ids:
+            nexus.sequencer.register_user(user_id)
+            nexus.sequencer.stake_tokens(user_id, 100)
+
+        latencies = [array("d") for _ in range(concurrency)]
+        outcomes = [[0, 0] for _ in range(concurrency)]  # [commits, rejects] per worker
+        quotas = [None] * concurrency
+        if transactions is not None:
+            quotas = [transactions // concurrency + (1 if i < transactions % concurrency else 0)
+                      for i in range(concurrency)]
+        stop = threading.Event()
+        done = threading.Event()
+        running = [concurrency]
+        running_lock = threading.Lock()
+
+        def worker(idx):
+            rng = np.random.default_rng(seed + idx)
+            samples, counts, quota = latencies[idx], outcomes[idx], quotas[idx]
+            n = 0
+            try:
+                while not stop.is_set() and (quota is None or n < quota):
+                    signals = rng.uniform(0.0, 2.5, 5)
+                    start = time.perf_counter()
+                    success, _ = nexus.process_transaction(signals, {"event": "SOAK"},
+                                                           user_id=user_ids[n % len(user_ids)])
+                    samples.append(time.perf_counter() - start)
+                    counts[0 if success else 1] += 1
+                    n += 1
+            finally:
+                with running_lock:
+                    running[0] -= 1
+                    if running[0] == 0:
+                        done.set()
+
+        ledger_start = _file_size(ledger_path)
+        rss_start = _rss_bytes()
+        timeline = []
+        threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(concurrency)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+
+        deadline = started + duration if duration is not None else None
+        while not done.is_set():
+            now = time.perf_counter()
+            if deadline is not None and now >= deadline:
+                stop.set()
+                break
+            wait = sample_interval if deadline is None else min(sample_interval, deadline - now)
+            done.wait(max(wait, 0.0))
+            timeline.append({
+                "elapsed_s": round(time.perf_counter() - started, 3),
+                "transactions": sum(len(samples) for samples in latencies),
+                "rss_bytes": _rss_bytes(),
+                "ledger_bytes": _file_size(ledger_path),
+            })
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        all_latencies = sorted(value for samples in latencies for value in samples)
+        commits = sum(counts[0] for counts in outcomes)
+        rejects = sum(counts[1] for counts in outcomes)
+        total = commits + rejects
+        rss_end = _rss_bytes()
+        ledger_end = _file_size(ledger_path)
+
+    return {
+        "transactions": total,
+        "concurrency": concurrency,
+        "duration_s": round(elapsed, 3),
+        "throughput_tps": round(total / elapsed, 2) if elapsed > 0 else 0.0,
+        "latency_ms": {
+            "p50": _percentile_ms(all_latencies, 50),
+            "p99": _percentile_ms(all_latencies, 99),
+            "p999": _percentile_ms(all_latencies, 99.9),
+        },
+        "commits": commits,
+        "rejects": rejects,
+        "commit_ratio": round(commits / total, 4) if total else 0.0,
+        "reject_ratio": round(rejects / total, 4) if total else 0.0,
+        "rss_growth_bytes": rss_end - rss_start,
+        "ledger_growth_bytes": ledger_end - ledger_start,
+        "timeline": timeline,
+    }
+
+
+def compare_to_baseline(report, baseline, tolerance=DEFAULT_TOLERANCE, ratio_tolerance=DEFAULT_RATIO_TOLERANCE):
+    """
+    Lists the ways `report` regressed past the thresholds relative to `baseline`.
+
+    Returns:
+        list: Human-readable regression descriptions; empty when within bounds.
+    """
+    regressions = []
+    base_tps = baseline.get("throughput_tps", 0)
+    if base_tps and report["throughput_tps"] < base_tps * (1 - tolerance):
+        regressions.append(f"throughput {report['throughput_tps']} tps < baseline {base_tps} tps "
+                           f"(-{tolerance:.0%} allowed)")
+    for key, value in report["latency_ms"].items():
+        base = baseline.get("latency_ms", {}).get(key, 0)
+        if base and value > base * (1 + tolerance):
+            regressions.append(f"latency {key} {value} ms > baseline {base} ms (+{tolerance:.0%} allowed)")
+    if "commit_ratio" in baseline and abs(report["commit_ratio"] - baseline["commit_ratio"]) > ratio_tolerance:
+        regressions.append(f"commit ratio {report['commit_ratio']} drifted from baseline "
+                           f"{baseline['commit_ratio']} (±{ratio_tolerance} allowed)")
+    return regressions
+
+
+def print_soak_report(report):
+    latency = report["latency_ms"]
+    print(f"Transactions: {report['transactions']} in {report['duration_s']} s "
+          f"({report['throughput_tps']} tps, concurrency {report['concurrency']})")
+    print(f"Latency: p50 {latency['p50']} ms | p99 {latency['p99']} ms | p999 {latency['p999']} ms")
+    print(f"Outcomes: {report['commits']} committed ({report['commit_ratio']:.2%}), "
+          f"{report['rejects']} rejected ({report['reject_ratio']:.2%})")
+    print(f"Growth: RSS {report['rss_growth_bytes'] / 1e6:+.2f} MB | ledger {report['ledger_growth_bytes'] / 1e6:+.2f} MB")
+
+
+def add_soak_arguments(parser):
+    parser.add_argument("--soak", action="store_true", help="Run a sustained-load soak instead of the quick check.")
+    parser.add_argument("--duration", type=float, default=None, help="Soak duration in seconds.")
+    parser.add_argument("--transactions", type=int, default=None, help="Soak transaction count.")
+    parser.add_argument("--concurrency", type=int, default=1, help="Concurrent submitting threads (default: 1).")
+    parser.add_argument("--threshold", type=float, default=float(os.getenv("NEXUS_THRESHOLD", "2.0")),
+                        help="Gate threshold (default: NEXUS_THRESHOLD or 2.0).")
+    parser.add_argument("--ledger", default=None, help="Ledger to append to (default: a temporary file).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for gate weights and signals (default: 0).")
+    parser.add_argument("--baseline", default=None, help="Baseline JSON report to compare against.")
+    parser.add_argument("--write-baseline", action="store_true", help="Store this run's report as the baseline.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed relative throughput/latency regression (default: 0.2).")
+    parser.add_argument("--ratio-tolerance", type=float, default=DEFAULT_RATIO_TOLERANCE,
+                        help="Allowed absolute commit-ratio drift (default: 0.05).")
+    parser.add_argument("--report", default=None, help="Write the full JSON report here.")
+
+
+def check_soak_arguments(parser, args):
+    """
+    Rejects option combinations argparse cannot express; exits via parser.error.
+    """
+    if args.write_baseline and not args.baseline:
+        parser.error("--write-baseline requires --baseline")
@@ -0,0 +1,41 @@
+import os
+import runpy
+
+import pytest
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts", "breeze_build.py.txt")
+
+
+@pytest.fixture
+def breeze_build(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "chat.py").write_text("print('breeze')\n")
+    return runpy.run_path(SCRIPT, run_name="breeze_build")
+
+
+def test_first_build_creates_full_and_stripped_variants(breeze_build, tmp_path):
+    summary = breeze_build["build"]()
+    assert summary == {"rebuilt": 6, "up_to_date": 0, "removed": 0}
+    assert sorted(os.listdir("Breeze_Full")) == [
+        "Cybersecurity_AI.py", "R&D_AI.py", "Red_Team_AI.py", "chat.py", "system_prompt.json"]
+    assert os.listdir("Breeze_Engine_Helper") == ["chat.py"]
+    assert (tmp_path / "Breeze_Engine_Helper" / "chat.py").read_text() == "print('breeze')\n"
+
+
+def test_noop_build_rewrites_nothing(breeze_build):
+    breeze_build["build"]()
+    mtime = os.stat("Breeze_Full/chat.py").st_mtime_ns
+    assert breeze_build["build"]() == {"rebuilt": 0, "up_to_date": 6, "removed": 0}
+    assert os.stat("Breeze_Full/chat.py").st_mtime_ns == mtime
+
+
+def test_only_changed_or_tampered_outputs_rebuild(breeze_build, tmp_path):
+    breeze_build["build"]()
+    (tmp_path / "scripts" / "chat.py").write_text("print('breeze v2')\n")
+    assert breeze_build["build"]()["rebuilt"] == 2  # chat.py in both variants
+
+    (tmp_path / "Breeze_Full" / "R&D_AI.py").write_text("tampered\n")
+    assert breeze_build["build"]()["rebuilt"] == 1
+    assert "created by Breeze" in (tmp_path / "Breeze_Full" / "R&D_AI.py").read_text()
+    assert breeze_build["build"](force=True)["rebuilt"] == 6
@@ -0,0 +1,101 @@
+import builtins
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from scripts import chat
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    calls = 0
+    truncate = False  # close the connection after the first chunk, without [DONE]
+
+    def do_POST(self):
+        type(self).calls += 1
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        assert body["stream"] is True and body["messages"][0]["role"] == "system"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        for token in ["Hello", ", ", body["messages"][-1]["content"]]:
+            chunk = {"choices": [{"delta": {"content": token}}]}
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            if type(self).truncate:
+                return
+        self.wfile.write(b"data: [DONE]\n\n")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_backend():
+    _StubHandler.calls = 0
+    _StubHandler.truncate = False
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield chat.HTTPBackend(f"http://127.0.0.1:{server.server_address[1]}/v1")
+    server.shutdown()
+    server.server_close()
+
+
+def test_streams_chunks_and_serves_repeats_from_cache(tmp_path, stub_backend):
+    cache = chat.ResponseCache(str(tmp_path / "cache.sqlite3"))
+    assert list(chat.stream_breeze("status?", stub_backend, cache)) == ["Hello", ", ", "status?"]
+    assert chat.query_breeze("  STATUS?  ", stub_backend, cache) == "Hello, status?"
+    assert _StubHandler.calls == 1
+    cache.close()
+
+    # The cache persists across restarts
+    reopened = chat.ResponseCache(str(tmp_path / "cache.sqlite3"))
+    assert chat.query_breeze("status?", stub_backend, reopened) == "Hello, status?"
+    assert _StubHandler.calls == 1
+
+
+def test_cache_is_keyed_by_backend_model(tmp_path, stub_backend):
+    cache = chat.ResponseCache(str(tmp_path / "cache.sqlite3"))
+    other = chat.HTTPBackend(stub_backend.url.rsplit("/chat/completions", 1)[0], model="other-model")
+    assert chat.query_breeze("status?", stub_backend, cache) == "Hello, status?"
+    assert chat.query_breeze("status?", other, cache) == "Hello, status?"
+    assert _StubHandler.calls == 2
+    assert cache.get(chat.ResponseCache.key("status?", "other-model")) == "Hello, status?"
+
+
+def test_truncated_stream_is_not_cached(tmp_path, stub_backend):
+    cache = chat.ResponseCache(str(tmp_path / "cache.sqlite3"))
+    _StubHandler.truncate = True
+    reply = chat.query_breeze("status?", stub_backend, cache)
+    assert reply.startswith("Hello") and "Error contacting AI" in reply
+    assert cache.get(chat.ResponseCache.key("status?")) is None
+
+    _StubHandler.truncate = False
+    assert chat.query_breeze("status?", stub_backend, cache) == "Hello, status?"
+    assert _StubHandler.calls == 2
+
+
+def test_cache_expires_and_evicts_least_recently_used(tmp_path):
+    cache = chat.ResponseCache(str(tmp_path / "cache.sqlite3"), max_entries=2, ttl=100)
+    cache.put("a", "A", now=0)
+    cache.put("b", "B", now=1)
+    assert cache.get("a", now=2) == "A"
+    cache.put("c", "C", now=3)
+    assert cache.get("b", now=4) is None
+    assert cache.get("a", now=4) == "A"
+    assert cache.get("a", now=101) is None
+
+
+def test_errors_are_not_cached(tmp_path):
+    cache = chat.ResponseCache(str(tmp_path / "cache.sqlite3"))
+    backend = chat.HTTPBackend("http://127.0.0.1:9", timeout=1)
+    assert chat.query_breeze("ping", backend, cache).startswith("Error contacting AI")
+    assert cache.get(chat.ResponseCache.key("ping")) is None
+
+
+def test_interactive_loop_runs_against_stub(tmp_path, stub_backend, monkeypatch, capsys):
+    inputs = iter(["hi there", "exit"])
+    monkeypatch.setattr(builtins, "input", lambda prompt="": next(inputs))
+    chat.main(backend=stub_backend, cache=chat.ResponseCache(str(tmp_path / "cache.sqlite3")))
+    assert "Hello, hi there" in capsys.readouterr().out
@@ -0,0 +1,49 @@
+import json
+import os
+import subprocess
+import sys
+
+import nexus
+from nexus import bench
+from nexus.cli import main
+
+# Generous ceiling for a cold `import nexus`; a regression here usually means
+# something heavy (NumPy, the core engine, logging setup) moved back to import time.
+STARTUP_BUDGET_MS = 1000
+
+
+def test_import_is_lazy_and_side_effect_free(tmp_path):
+    probe = (
+        "import logging, sys, nexus; "
+        "print(sorted(m for m in ('numpy', 'nexus.core', 'nexus.log') if m in sys.modules)); "
+        "print(len(logging.getLogger().handlers))"
+    )
+    out = subprocess.run([sys.executable, "-c", probe], cwd=tmp_path, capture_output=True, text=True, check=True,
+                         env={"PYTHONPATH": os.path.dirname(nexus.__path__[0])})
+    assert out.stdout.split() == ["[]", "0"]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_lazy_attribute_resolves_submodule():
+    from nexus.sequencer import Sequencer
+    assert nexus.Sequencer is Sequencer
+
+
+def test_cold_start_within_budget():
+    summary = bench.summarize(bench.measure_startup("import nexus, nexus.cli", runs=3))
+    assert summary["median_ms"] < STARTUP_BUDGET_MS
+
+
+def test_verify_flags_bad_ledger_lines(tmp_path, capsys):
+    ledger = tmp_path / "ledger.json"
+    good = {"epoch": "a" * 64, "status": "COMMITTED", "timestamp": "2026-02-09T19:45:27"}
+    ledger.write_text(json.dumps(good) + "\n")
+    assert main(["verify", str(ledger)]) == 0
+
+    with open(ledger, "a") as f:
+        f.write("not json\n")
+        f.write(json.dumps({"epoch": "xyz", "status": "COMMITTED", "timestamp": "t"}) + "\n")
+    assert main(["verify", str(ledger)]) == 1
+    out = capsys.readouterr().out
+    assert "line 2: MALFORMED_JSON" in out
+    assert "line 3: INVALID_EPOCH" in out
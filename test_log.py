@@ -0,0 +1,55 @@
+import logging
+
+import pytest
+
+from nexus import log as nexus_log
+
+
+def _record(event=None):
+    record = logging.LogRecord("nexus.test", logging.INFO, __file__, 0, "msg", None, None)
+    if event:
+        record.event = event
+    return record
+
+
+def test_sampling_keeps_one_in_n_per_event():
+    sampler = nexus_log.EventSamplingFilter({"DEFENSE_STABLE": 3, "COMMITTED": 1})
+    kept = [sampler.filter(_record("DEFENSE_STABLE")) for _ in range(7)]
+    assert kept == [True, False, False, True, False, False, True]
+    assert all(sampler.filter(_record("COMMITTED")) for _ in range(3))
+    assert all(sampler.filter(_record("SLASHED")) for _ in range(3))
+    assert sampler.filter(_record())
+
+
+def test_parse_sample_rates():
+    assert nexus_log.parse_sample_rates("DEFENSE_STABLE=100, GATE_CLOSED=10,") == {
+        "DEFENSE_STABLE": 100, "GATE_CLOSED": 10,
+    }
+    assert nexus_log.parse_sample_rates(None) == {}
+    with pytest.raises(ValueError):
+        nexus_log.parse_sample_rates("DEFENSE_STABLE=often")
+
+
+def test_handlers_are_installed_only_by_configure(tmp_path):
+    root = logging.getLogger(nexus_log.ROOT_LOGGER)
+    assert [type(h) for h in root.handlers] == [logging.NullHandler]
+
+    log_path = tmp_path / "nexus.log"
+    try:
+        listener = nexus_log.configure(level="INFO", log_path=str(log_path), stream=False,
+                                       sample_rates={"DEFENSE_STABLE": 2})
+        assert sum(isinstance(h, logging.handlers.QueueHandler) for h in root.handlers) == 1
+        assert [type(h) for h in listener.handlers] == [logging.FileHandler]
+
+        logger = nexus_log.get_logger("test")
+        for i in range(4):
+            logger.info("probe %d", i, extra={"event": "DEFENSE_STABLE"})
+        nexus_log.shutdown()
+    finally:
+        nexus_log.shutdown()
+        root.propagate = True
+        root.setLevel(logging.NOTSET)
+
+    assert [type(h) for h in root.handlers] == [logging.NullHandler]
+    lines = log_path.read_text().splitlines()
+    assert [line.split(": ", 1)[1] for line in lines] == ["probe 0", "probe 2"]
@@ -0,0 +1,118 @@
+import json
+
+import numpy as np
+import pytest
+
+from nexus.cli import main
+from nexus.core import NexusCore
+from nexus.entropic_anchor import EntropicAnchor
+from nexus.merkle import BlockStore, build_proof, leaf_hash, merkle_root, node_hash, verify_proof
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 8, 33])
+def test_every_leaf_proves_against_root(size):
+    epochs = [f"{i:064x}" for i in range(size)]
+    root = merkle_root(epochs)
+    for index, epoch in enumerate(epochs):
+        proof = {"epoch": epoch, "root": root, "path": build_proof(epochs, index)}
+        assert len(proof["path"]) <= max(1, (size - 1).bit_length())
+        assert verify_proof(proof, root)
+
+
+def test_tampered_proofs_are_rejected():
+    epochs = [f"{i:064x}" for i in range(5)]
+    root = merkle_root(epochs)
+    proof = {"epoch": epochs[2], "root": root, "path": build_proof(epochs, 2)}
+    assert not verify_proof(dict(proof, epoch=epochs[3]), root)
+    assert not verify_proof(proof, trusted_root="0" * 64)
+    assert not verify_proof(proof, None)
+    proof["path"][0]["side"] = "left" if proof["path"][0]["side"] == "right" else "right"
+    assert not verify_proof(proof, root)
+
+
+def test_forged_proof_needs_a_trusted_root(tmp_path, capsys):
+    epochs = [f"{i:064x}" for i in range(4)]
+    ledger, blocks, forged = tmp_path / "ledger.json", tmp_path / "blocks.json", tmp_path / "forged.json"
+    ledger.write_text("".join(json.dumps({"epoch": e, "status": "COMMITTED", "timestamp": "t"}) + "\n" for e in epochs))
+    assert main(["seal", str(ledger), "--blocks", str(blocks)]) == 0
+
+    # A self-consistent proof for an epoch that was never sealed
+    epoch, sibling = "e" * 64, "a" * 64
+    forged.write_text(json.dumps({"epoch": epoch, "block": 0, "root": node_hash(leaf_hash(epoch), sibling),
+                                  "path": [{"hash": sibling, "side": "right"}]}))
+    with pytest.raises(SystemExit):
+        main(["verify-proof", str(forged)])
+    assert main(["verify-proof", str(forged), "--blocks", str(blocks)]) == 1
+    assert main(["verify-proof", str(forged), "--blocks", str(tmp_path / "missing.json")]) == 1
+
+
+def test_core_seals_blocks_and_proofs_verify_without_ledger(tmp_path):
+    blocks = tmp_path / "blocks.json"
+    nexus = NexusCore(threshold=-1000, ledger_path=str(tmp_path / "ledger.json"), blocks_path=str(blocks), block_size=4)
+    epochs = [nexus.process_transaction(np.ones(5), {"event": "MERKLE_TEST"})[1]["epoch"] for _ in range(10)]
+    nexus.block_builder.flush()
+
+    store = BlockStore(str(blocks))
+    assert len(store.roots) == 3
+    proof = store.prove(epochs[5])
+    assert (proof["block"], proof["index"]) == (1, 1)
+    assert EntropicAnchor().validate_epoch_inclusion(proof, store.roots[1]) == "STATE_SYNCHRONIZED"
+    with pytest.raises(Exception, match="SYSTEM_ENTROPY_COLLAPSE"):
+        EntropicAnchor().validate_epoch_inclusion(proof, store.roots[0])
+
+
+def test_restart_seals_epochs_left_pending(tmp_path):
+    ledger, blocks = str(tmp_path / "ledger.json"), str(tmp_path / "blocks.json")
+    nexus = NexusCore(threshold=-1000, ledger_path=ledger, blocks_path=blocks, block_size=4)
+    epochs = [nexus.process_transaction(np.ones(5), {"event": "MERKLE_TEST"})[1]["epoch"] for _ in range(6)]
+    # Crash: the two epochs pending in the builder are never flushed
+    assert len(BlockStore(blocks).roots) == 1
+
+    restarted = NexusCore(threshold=-1000, ledger_path=ledger, blocks_path=blocks, block_size=4)
+    store = BlockStore(blocks)
+    assert len(store.roots) == 2
+    assert all(store.prove(epoch) for epoch in epochs)
+    assert restarted.block_builder.recover(ledger) == 0
+
+
+def test_torn_block_record_is_repaired_on_startup(tmp_path):
+    ledger, blocks = str(tmp_path / "ledger.json"), str(tmp_path / "blocks.json")
+    nexus = NexusCore(threshold=-1000, ledger_path=ledger, blocks_path=blocks, block_size=4)
+    epochs = [nexus.process_transaction(np.ones(5), {"event": "MERKLE_TEST"})[1]["epoch"] for _ in range(8)]
+    # Crash mid-append: the second block's record is cut short, and so is the ledger's last line
+    with open(blocks, "rb+") as f:
+        f.truncate(f.seek(0, 2) - 100)
+    with open(ledger, "a") as f:
+        f.write('{"epoch": "torn')
+
+    restarted = NexusCore(threshold=-1000, ledger_path=ledger, blocks_path=blocks, block_size=4)
+    store = BlockStore(blocks)
+    assert len(store.roots) == 2
+    assert restarted.block_builder.next_block == 2
+    assert all(store.prove(epoch) for epoch in epochs)
+
+
+def test_block_store_ignores_a_torn_final_record(tmp_path):
+    blocks = tmp_path / "blocks.json"
+    epochs = [f"{i:064x}" for i in range(3)]
+    blocks.write_text(json.dumps({"block": 0, "root": merkle_root(epochs), "size": 3, "epochs": epochs}) + "\n"
+                      + '{"block": 1, "root": "ab')
+    store = BlockStore(str(blocks))
+    assert len(store.roots) == 1
+    assert verify_proof(store.prove(epochs[1]), store.roots[0])
+
+
+def test_cli_seal_prove_and_verify(tmp_path, capsys):
+    ledger, blocks, proof_path = tmp_path / "ledger.json", tmp_path / "blocks.json", tmp_path / "proof.json"
+    epochs = [f"{i:064x}" for i in range(6)]
+    ledger.write_text("".join(json.dumps({"epoch": e, "status": "COMMITTED", "timestamp": "t"}) + "\n" for e in epochs))
+
+    assert main(["seal", str(ledger), "--blocks", str(blocks), "--block-size", "4"]) == 0
+    capsys.readouterr()
+    assert main(["prove", epochs[4], "--blocks", str(blocks)]) == 0
+    proof_path.write_text(capsys.readouterr().out)
+    root = json.loads(proof_path.read_text())["root"]
+    assert main(["verify-proof", str(proof_path), "--root", root]) == 0
+    assert main(["verify-proof", str(proof_path), "--root", "0" * 64]) == 1
+    assert main(["verify-proof", str(proof_path), "--blocks", str(blocks)]) == 0
+    assert main(["prove", "f" * 64, "--blocks", str(blocks)]) == 1
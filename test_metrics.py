@@ -0,0 +1,129 @@
+import json
+import os
+import signal
+import time
+
+from nexus.metrics import MetricsRegistry, Histogram, export_on_signal
+
+
+def test_disabled_registry_records_nothing():
+    metrics = MetricsRegistry(enabled=False)
+    with metrics.time("core.gate"):
+        pass
+    metrics.inc("core.commits")
+    assert metrics.histograms == {}
+    assert metrics.counters == {}
+
+
+def test_stage_timer_and_counters():
+    metrics = MetricsRegistry(enabled=True)
+    for _ in range(3):
+        with metrics.time("core.ledger"):
+            pass
+    metrics.inc("core.commits")
+    metrics.inc("core.slashes", 2)
+
+    assert metrics.histogram("core.ledger").count == 3
+    snapshot = json.loads(metrics.to_json())
+    assert snapshot["events"] == {"core.commits": 1, "core.slashes": 2}
+    assert snapshot["stages"]["core.ledger"]["count"] == 3
+
+
+def test_histogram_percentiles_follow_buckets():
+    hist = Histogram("core.anchor", buckets=(0.001, 0.01, 0.1))
+    for _ in range(99):
+        hist.observe(0.0005)
+    hist.observe(0.05)
+    assert hist.percentile(50) == 0.001
+    assert hist.percentile(100) == 0.1
+    hist.observe(5.0)
+    assert hist.percentile(100) == float("inf")
+
+
+def test_prometheus_export_is_cumulative():
+    metrics = MetricsRegistry(enabled=True, buckets=(0.001, 0.01))
+    metrics.histogram("core.gate").observe(0.0001)
+    metrics.histogram("core.gate").observe(0.005)
+    metrics.inc("core.rejections")
+    text = metrics.to_prometheus()
+    assert 'nexus_stage_duration_seconds_bucket{stage="core.gate",le="0.001"} 1' in text
+    assert 'nexus_stage_duration_seconds_bucket{stage="core.gate",le="0.01"} 2' in text
+    assert 'nexus_stage_duration_seconds_count{stage="core.gate"} 2' in text
+    assert 'nexus_events_total{event="core.rejections"} 1' in text
+
+
+def test_core_records_stages_and_events(tmp_path):
+    import numpy as np
+
+    from nexus.core import NexusCore
+
+    metrics = MetricsRegistry(enabled=True)
+    nexus = NexusCore(threshold=-1000, ledger_path=str(tmp_path / "ledger.json"), metrics=metrics)
+    nexus.sequencer.register_user("user1")
+    nexus.sequencer.stake_tokens("user1", 100)
+
+    assert nexus.process_transaction(np.ones(5), {"event": "METRICS_TEST"}, user_id="user1")[0]
+    nexus.threshold = 1000
+    assert nexus.process_transaction(np.ones(5), {"event": "METRICS_TEST"}, user_id="user1") == (False, "GATE_CLOSED")
+
+    snapshot = metrics.to_dict()
+    assert {stage: snap["count"] for stage, snap in snapshot["stages"].items()} == {
+        "core.transaction": 2, "core.gate": 2, "core.legal": 2, "core.anchor": 2,
+        "core.ledger": 1, "core.gate_adjust": 2, "core.sequencer": 1,
+    }
+    assert snapshot["events"] == {"core.commits": 1, "core.rejections": 1, "core.slashes": 1}
+
+
+def test_agents_report_through_injected_registry():
+    from nexus.homeostatic_recovery import HomeostaticRecovery
+    from redteam_ai.cybersecurity_ai.cybersecurity_ai import CybersecurityAI
+
+    class Engine:
+        def calculate_syntropy_yield(self, *args):
+            return 0.95
+
+    metrics = MetricsRegistry(enabled=True)
+    CybersecurityAI(["Failed login for root", "ok"], metrics=metrics).analyze()
+    HomeostaticRecovery(Engine(), metrics=metrics).heal({"status": "RECOVER", "system_id": "NX", "syntropy_index": 0.4})
+
+    assert metrics.to_dict()["events"] == {
+        "cybersecurity.entries_scanned": 2, "cybersecurity.anomalies": 1, "recovery.heals": 1,
+    }
+    for stage in ("cybersecurity.detect", "cybersecurity.respond", "recovery.isolate", "recovery.syntropy",
+                  "recovery.heal"):
+        assert metrics.histogram(stage).count == 1
+
+
+def test_export_on_sigusr1(tmp_path):
+    metrics = MetricsRegistry(enabled=True)
+    metrics.inc("core.commits")
+    path = tmp_path / "metrics.json"
+    previous = export_on_signal(str(path), "json", metrics=metrics)
+    try:
+        os.kill(os.getpid(), signal.SIGUSR1)
+        deadline = time.monotonic() + 5
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        signal.signal(signal.SIGUSR1, previous)
+    assert json.loads(path.read_text())["events"] == {"core.commits": 1}
+
+
+def test_nexus_run_writes_metrics_at_shutdown(tmp_path, monkeypatch):
+    from nexus import core, metrics
+    from nexus.cli import main
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("NEXUS_LEDGER_PATH", str(tmp_path / "ledger.json"))
+    monkeypatch.setenv("NEXUS_BLOCKS_PATH", "")
+    monkeypatch.setattr(core.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(metrics.registry, "enabled", False)
+    metrics.registry.reset()
+    try:
+        path = tmp_path / "metrics.prom"
+        assert main(["run", "--metrics", str(path)]) == 0
+        text = path.read_text()
+    finally:
+        metrics.registry.reset()
+    assert 'nexus_stage_duration_seconds_count{stage="core.transaction"}' in text
+    assert "nexus_events_total" in text
@@ -1,4 +1,4 @@
-from nexus_full_build import NexusCore
+from nexus.core import NexusCore
 import os
 import json
 import numpy as np
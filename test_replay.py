@@ -0,0 +1,85 @@
+import json
+
+import numpy as np
+
+from nexus.cli import main
+from nexus.core import NexusCore
+from nexus.replay import TraceRecorder, diff_ledgers, read_trace, replay_trace, sequencer_state
+
+
+def _record(tmp_path, transactions=30, nexus=None):
+    trace = tmp_path / "trace.jsonl.gz"
+    nexus = nexus or NexusCore(threshold=0.5, ledger_path=str(tmp_path / "live.json"), rng=np.random.default_rng(1))
+    with TraceRecorder(str(trace)).attach(nexus):
+        for user in ("user1", "user2"):
+            nexus.sequencer.register_user(user)
+            nexus.sequencer.stake_tokens(user, 100)
+        rng = np.random.default_rng(7)
+        for i in range(transactions):
+            nexus.process_transaction(rng.uniform(-1, 2, 5), {"event": "REPLAY_TEST"}, user_id=f"user{i % 2 + 1}")
+    return trace
+
+
+def test_trace_round_trips_events(tmp_path):
+    header, events = read_trace(str(_record(tmp_path)))
+    events = list(events)
+    assert header["threshold"] == 0.5
+    assert [e[0] for e in events[:4]] == ["register", "stake", "register", "stake"]
+    assert sum(1 for e in events if e[0] == "tx") == 30
+    assert all(e[1] >= 0 for e in events)
+
+
+def test_replay_reproduces_live_decisions(tmp_path):
+    for seed in range(5):
+        live = NexusCore(threshold=0.5, ledger_path=str(tmp_path / f"live{seed}.json"),
+                         rng=np.random.default_rng(100 + seed))
+        trace = str(_record(tmp_path, transactions=100, nexus=live))
+        report = replay_trace(trace, str(tmp_path / f"replay{seed}.json"), seed=seed)
+
+        live_statuses = [json.loads(line)["status"] for line in open(tmp_path / f"live{seed}.json")]
+        assert report["commits"] == len(live_statuses)
+        assert report["sequencer"] == sequencer_state(live.sequencer)
+
+
+def test_recording_never_fails_the_live_transaction(tmp_path):
+    nexus = NexusCore(threshold=-1000, ledger_path=str(tmp_path / "live.json"))
+    with TraceRecorder(str(tmp_path / "trace.jsonl.gz")).attach(nexus) as recorder:
+        assert nexus.process_transaction(np.ones(5), {"amount": np.float32(1.5)})[0]
+        assert nexus.process_transaction(np.ones(5), {"handle": object()})[0]
+    assert (recorder.events, recorder.skipped) == (1, 1)
+    _, events = read_trace(str(tmp_path / "trace.jsonl.gz"))
+    assert [event[3] for event in events] == [{"amount": 1.5}]
+
+
+def test_replay_starts_from_the_sequencer_state_at_attach(tmp_path):
+    live = NexusCore(threshold=0.5, ledger_path=str(tmp_path / "live.json"), rng=np.random.default_rng(2))
+    live.sequencer.register_user("veteran")
+    live.sequencer.stake_tokens("veteran", np.int64(500))
+    live.sequencer.slash_user("veteran")
+    trace = str(_record(tmp_path, transactions=20, nexus=live))
+
+    report = replay_trace(trace, str(tmp_path / "replay.json"))
+    assert report["sequencer"] == json.loads(json.dumps(sequencer_state(live.sequencer), default=lambda v: v.item()))
+
+
+def test_replay_is_deterministic_per_seed(tmp_path):
+    trace = str(_record(tmp_path))
+    first = replay_trace(trace, str(tmp_path / "a.json"), seed=3)
+    second = replay_trace(trace, str(tmp_path / "b.json"), seed=3)
+    assert first["transactions"] == 30
+    assert first["commits"] > 0
+    assert diff_ledgers(str(tmp_path / "a.json"), str(tmp_path / "b.json")) == []
+    assert first["sequencer"] == second["sequencer"]
+
+    replay_trace(trace, str(tmp_path / "c.json"), seed=4)
+    assert diff_ledgers(str(tmp_path / "a.json"), str(tmp_path / "c.json")) != []
+
+
+def test_cli_replay_diffs_against_previous_run(tmp_path):
+    trace = str(_record(tmp_path))
+    base = ["replay", trace, "--state", str(tmp_path / "state.json"), "--ledger", str(tmp_path / "base.json")]
+    assert main(base) == 0
+    again = ["replay", trace, "--ledger", str(tmp_path / "again.json"),
+             "--against-ledger", str(tmp_path / "base.json"), "--against-state", str(tmp_path / "state.json")]
+    assert main(again) == 0
+    assert main(again + ["--seed", "1"]) == 1
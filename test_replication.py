@@ -0,0 +1,109 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+import nexus
+from nexus.replication import LedgerFollower, LedgerShipper, config_from_env
+
+
+def _append(path, count, start=0):
+    with open(path, "a", encoding="utf-8") as f:
+        for i in range(start, start + count):
+            f.write(json.dumps({"epoch": f"{i:064x}", "status": "COMMITTED", "timestamp": str(i)}) + "\n")
+
+
+def _wait_for_file(path, expected, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if os.path.exists(path) and open(path, "rb").read() == expected:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_follower_mirrors_primary_and_resumes_after_reconnect(tmp_path):
+    primary, secondary = tmp_path / "primary.json", tmp_path / "secondary.json"
+    _append(primary, 600)
+    shipper = LedgerShipper(str(primary), port=0, batch_size=100, poll_interval=0.05).start()
+    port = shipper.address[1]
+    try:
+        follower = LedgerFollower(str(secondary), "SECONDARY-BETA", port=port, reconnect_interval=0.05).start()
+        assert shipper.wait_for_ack("SECONDARY-BETA", 600, timeout=10)
+        follower.stop()
+        assert secondary.read_bytes() == primary.read_bytes()
+
+        # Appends made while the follower is away are caught up from its offset
+        _append(primary, 50, start=600)
+        follower = LedgerFollower(str(secondary), "SECONDARY-BETA", port=port, reconnect_interval=0.05)
+        assert follower.offset == 600
+        follower.start()
+        assert shipper.wait_for_ack("SECONDARY-BETA", 650, timeout=10)
+        follower.stop()
+        assert secondary.read_bytes() == primary.read_bytes()
+    finally:
+        shipper.stop()
+
+
+def test_follower_truncates_torn_tail(tmp_path):
+    ledger = tmp_path / "secondary.json"
+    _append(ledger, 3)
+    with open(ledger, "a") as f:
+        f.write('{"epoch": "trunc')
+    assert LedgerFollower(str(ledger), "SECONDARY-BETA").offset == 3
+    assert ledger.read_bytes().endswith(b"\n")
+
+
+def test_follower_ahead_of_primary_is_refused(tmp_path):
+    primary, secondary = tmp_path / "primary.json", tmp_path / "secondary.json"
+    _append(primary, 2)
+    _append(secondary, 5)
+    shipper = LedgerShipper(str(primary), port=0, poll_interval=0.05).start()
+    try:
+        follower = LedgerFollower(str(secondary), "SECONDARY-BETA", port=shipper.address[1]).start()
+        follower._thread.join(timeout=10)
+        assert follower.error is not None
+    finally:
+        shipper.stop()
+
+
+def test_config_from_env_derives_role_from_node_id():
+    assert config_from_env({"NEXUS_NODE_ID": "PRIMARY-ALPHA"})["role"] == "primary"
+    config = config_from_env({"NEXUS_NODE_ID": "SECONDARY-BETA", "NEXUS_THRESHOLD": "1.8"})
+    assert config["role"] == "follower"
+    assert config["threshold"] == 1.8
+
+
+def test_two_process_replication(tmp_path):
+    primary, secondary = tmp_path / "primary.json", tmp_path / "secondary.json"
+    _append(primary, 20)
+    shipper = LedgerShipper(str(primary), port=0, poll_interval=0.05).start()
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(nexus.__path__[0]), NEXUS_NODE_ID="SECONDARY-BETA")
+    follower = subprocess.Popen([sys.executable, "-m", "nexus", "replicate", "--ledger", str(secondary),
+                                 "--port", str(shipper.address[1])], env=env)
+    try:
+        assert shipper.wait_for_ack("SECONDARY-BETA", 20, timeout=20)
+        _append(primary, 5, start=20)
+        shipper.notify()
+        assert _wait_for_file(secondary, primary.read_bytes())
+    finally:
+        follower.terminate()
+        follower.wait(timeout=10)
+        shipper.stop()
+
+
+def test_engine_refuses_to_write_the_replication_mirror(tmp_path, monkeypatch):
+    from nexus.core import main as run_core
+
+    mirror = tmp_path / "mirror.json"
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("NEXUS_NODE_ID", "SECONDARY-BETA")
+    monkeypatch.setenv("NEXUS_LEDGER_PATH", str(mirror))
+    monkeypatch.setenv("NEXUS_REPLICA_PATH", str(mirror))
+    assert run_core() == 1
+    assert not mirror.exists()
+
+    monkeypatch.setenv("NEXUS_LEDGER_PATH", str(tmp_path / "local.json"))
+    assert run_core(ship=True) == 1
+    assert not (tmp_path / "local.json").exists()
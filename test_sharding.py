@@ -0,0 +1,87 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from nexus.sharding import ShardError, ShardedNexus
+
+
+def test_transactions_route_by_user_and_ledgers_merge(tmp_path):
+    users = [f"user{i}" for i in range(8)]
+    with ShardedNexus(shards=3, threshold=-1000, ledger_dir=str(tmp_path), batch_capacity=4, seed=0) as nexus:
+        for user in users:
+            nexus.register_user(user)
+            nexus.stake_tokens(user, 100)
+        assert nexus.shard_for("user1") == nexus.shard_for("user1")
+
+        signals = np.tile(np.array([0.1, 0.2, 0.3, 0.4, 0.5]), (20, 1))
+        user_ids = [users[i % len(users)] for i in range(20)]
+        results = nexus.process_batch(signals, {"event": "SHARD_TEST"}, user_ids)
+        assert len(results) == 20
+        assert all(success for success, _ in results)
+
+        single = nexus.process_transaction(signals[0], {"event": "SHARD_TEST"}, user_id="user3")
+        assert single[0] is True
+
+        merged = list(nexus.merged_ledger())
+        assert len(merged) == 21
+        assert [entry["timestamp"] for entry in merged] == sorted(entry["timestamp"] for entry in merged)
+        assert {entry["shard"] for entry in merged} <= {0, 1, 2}
+
+
+def test_slashes_and_leaderboard_span_shards(tmp_path):
+    with ShardedNexus(shards=2, threshold=1e9, ledger_dir=str(tmp_path), seed=0) as nexus:
+        for user in ("alice", "bob", "carol", "dave"):
+            nexus.register_user(user)
+        success, reason = nexus.process_transaction(np.ones(5), {"event": "SHARD_TEST"}, user_id="alice")
+        assert (success, reason) == (False, "GATE_CLOSED")
+
+        scores = nexus.display_scores()
+        assert set(scores) == {"alice", "bob", "carol", "dave"}
+        assert scores["alice"] < scores["bob"]
+        assert "alice" not in nexus.compete()
+
+
+def test_shard_locks_are_taken_in_index_order(tmp_path):
+    with ShardedNexus(shards=3, threshold=-1000, ledger_dir=str(tmp_path), seed=0) as nexus:
+        users = [f"user{i}" for i in range(12)]
+        # Rows reach the highest shard first, so unordered locking would take its lock before shard 0's
+        reverse = sorted(users, key=nexus.shard_for, reverse=True)
+        first, last = nexus.shards[0], nexus.shards[-1]
+
+        first.lock.acquire()
+        batch = threading.Thread(target=nexus.process_batch, args=(np.ones((12, 5)), {"event": "SHARD_TEST"}, reverse))
+        scores = threading.Thread(target=nexus.display_scores)
+        try:
+            batch.start()
+            scores.start()
+            time.sleep(0.2)
+            # Both wait on shard 0 without holding any other shard (or its pipe)
+            assert batch.is_alive() and scores.is_alive()
+            assert last.lock.acquire(blocking=False)
+            last.lock.release()
+        finally:
+            first.lock.release()
+        batch.join(timeout=30)
+        scores.join(timeout=30)
+        assert sum(1 for _ in nexus.merged_ledger()) == 12
+
+
+def test_dead_shard_raises_and_releases_every_lock(tmp_path):
+    with ShardedNexus(shards=3, threshold=-1000, ledger_dir=str(tmp_path), seed=0) as nexus:
+        users = [f"user{i}" for i in range(12)]
+        alive_user = next(user for user in users if nexus.shard_for(user) == 1)
+        nexus.shards[0].process.kill()
+        nexus.shards[0].process.join()
+
+        with pytest.raises(ShardError):
+            nexus.process_batch(np.ones((12, 5)), {"event": "SHARD_TEST"}, users)
+        assert not any(shard.lock.locked() for shard in nexus.shards)
+        with pytest.raises(ShardError):
+            nexus.display_scores()
+        assert not any(shard.lock.locked() for shard in nexus.shards)
+
+        # Live shards answer the next request with its own reply, not a stale batch reply
+        success, result = nexus.process_transaction(np.ones(5), {"event": "SHARD_TEST"}, user_id=alive_user)
+        assert success is True and "epoch" in result
@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from nexus.cli import main
+from nexus.soak import compare_to_baseline, run_soak
+
+
+def test_soak_reports_throughput_latency_and_ratios():
+    report = run_soak(transactions=200, concurrency=2, threshold=1.0, sample_interval=0.01)
+    assert report["transactions"] == 200
+    assert report["commits"] + report["rejects"] == 200
+    assert abs(report["commit_ratio"] + report["reject_ratio"] - 1.0) < 1e-3
+    assert 0 < report["latency_ms"]["p50"] <= report["latency_ms"]["p99"] <= report["latency_ms"]["p999"]
+    assert report["ledger_growth_bytes"] > 0 or report["commits"] == 0
+
+
+def test_compare_to_baseline_flags_regressions():
+    baseline = {"throughput_tps": 1000.0, "latency_ms": {"p50": 1.0, "p99": 2.0, "p999": 3.0}, "commit_ratio": 0.5}
+    healthy = {"throughput_tps": 950.0, "latency_ms": {"p50": 1.1, "p99": 2.1, "p999": 3.5}, "commit_ratio": 0.52}
+    assert compare_to_baseline(healthy, baseline) == []
+
+    slow = {"throughput_tps": 500.0, "latency_ms": {"p50": 1.0, "p99": 5.0, "p999": 3.0}, "commit_ratio": 0.7}
+    regressions = compare_to_baseline(slow, baseline)
+    assert len(regressions) == 3
+    assert regressions[0].startswith("throughput")
+
+
+def test_soak_gate_exits_non_zero_on_regression(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    args = ["health", "--soak", "--transactions", "100", "--baseline", str(baseline)]
+    assert main(args + ["--write-baseline"]) == 0
+
+    stored = json.loads(baseline.read_text())
+    stored["throughput_tps"] *= 1000
+    baseline.write_text(json.dumps(stored))
+    assert main(args) == 1
+
+
+def test_write_baseline_requires_baseline():
+    with pytest.raises(SystemExit) as exc:
+        main(["health", "--soak", "--transactions", "10", "--write-baseline"])
+    assert exc.value.code == 2
+
+
+def test_quick_health_check_passes_on_a_healthy_core(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    for _ in range(5):
+        assert main(["health"]) == 0
+        assert "SYSTEM STATUS NOMINAL" in capsys.readouterr().out
+    # The probe transactions never touch the working directory's ledger
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_quick_health_check_fails_on_envelope_bypass(monkeypatch, capsys):
+    from nexus.core import LegalVerificationLayer
+
+    monkeypatch.setattr(LegalVerificationLayer, "verify_admissibility", lambda self, data: (True, "VERIFIED_ADMISSIBLE"))
+    assert main(["health"]) == 1
+    out = capsys.readouterr().out
+    assert "Law Envelope bypass detected" in out
+    assert "SYSTEM STATUS DEGRADED" in out
+
+
+def test_soak_leaves_global_numpy_state_alone():
+    import numpy as np
+
+    np.random.seed(1234)
+    expected = np.random.random()
+    np.random.seed(1234)
+    first = run_soak(transactions=50, threshold=1.0, seed=5)
+    assert np.random.random() == expected
+    assert run_soak(transactions=50, threshold=1.0, seed=5)["commits"] == first["commits"]